@@ -3,7 +3,7 @@
 import streamlit as st
 
 from page_managers import TeamManager
-from utils import GraphType
+from utils import GraphType, setup_page
 
 # Configuration for Streamlit
 st.set_page_config(
@@ -11,6 +11,7 @@ st.set_page_config(
     page_title="Teams",
     page_icon="🤖",
 )
+setup_page()
 team_manager = TeamManager()
 
 if __name__ == '__main__':
@@ -8,14 +8,13 @@ import streamlit as st
 
 from .page_manager import PageManager
 from utils import (
-    CalculatedStats,
     graphing,
     plotly_chart,
     populate_missing_data,
     Queries,
-    retrieve_scouting_data,
     retrieve_team_list,
-    scouting_data_for_team
+    scouting_data_for_team,
+    shared_calculated_stats
 )
 
 
@@ -23,9 +22,7 @@ class CustomGraphsManager(PageManager):
     """The page manager for the `Custom Graphs` page."""
 
     def __init__(self):
-        self.calculated_stats = CalculatedStats(
-            retrieve_scouting_data()
-        )
+        self.calculated_stats = shared_calculated_stats()
 
     def generate_input_section(self) -> list[list, list, Callable, str]:
         """Creates the input section for the `Custom Graphs` page.
@@ -128,7 +125,7 @@ class CustomGraphsManager(PageManager):
 
         if graph_name == "Line graph":
             return [
-                [scouting_data_for_team(team_number)[Queries.MATCH_KEY] for team_number in teams_selected][0],
+                [scouting_data_for_team(team_number, self.calculated_stats.data)[Queries.MATCH_KEY] for team_number in teams_selected][0],
                 y_data[0],
                 graph_selected,
                 stat_selected
@@ -7,14 +7,14 @@ from pandas import Series
 from .page_manager import PageManager
 from utils import (
     box_plot,
-    CalculatedStats,
     colored_metric,
     GeneralConstants,
     GraphType,
     plotly_chart,
     Queries,
     retrieve_team_list,
-    retrieve_scouting_data
+    scouting_data_for_team,
+    shared_calculated_stats
 )
 
 
@@ -24,48 +24,38 @@ class EventManager(PageManager):
     TEAMS_TO_SPLIT_BY = 10
 
     def __init__(self):
-        self.calculated_stats = CalculatedStats(
-            retrieve_scouting_data()
-        )
+        self.calculated_stats = shared_calculated_stats()
+
+    @st.cache_data(max_entries=2)
+    def _retrieve_driver_rating_distributions(_self, version: str) -> list:
+        """Retrieves numeric driver rating distributions across all teams at the event.
 
-    @st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
-    def _retrieve_driver_rating_distributions(_self) -> list:
-        """Retrieves numeric driver rating distributions across all teams at the event."""
-        from utils.constants import Criteria
-        teams = retrieve_team_list()
+        :param version: The version of the scouting data (see `CalculatedStats.version`), which the cache is keyed on.
+        """
+        teams = retrieve_team_list(_self.calculated_stats.data)
         distributions = []
         for team in teams:
-            team_data = _self.calculated_stats.data[
-                _self.calculated_stats.data[Queries.TEAM_NUMBER] == team
-            ]
+            team_data = scouting_data_for_team(team, _self.calculated_stats.data)
             if team_data.empty:
                 distributions.append(Series(dtype=float))
                 continue
-            distributions.append(
-                team_data[Queries.DRIVER_RATING].apply(
-                    lambda v: Criteria.DRIVER_RATING_CRITERIA.get(v, float("nan"))
-                ).dropna()
-            )
+            distributions.append(team_data[Queries.DRIVER_RATING_VALUE].dropna().astype(float))
         return distributions
 
-    @st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
-    def _retrieve_throughput_distributions(_self) -> list:
-        """Retrieves numeric throughput speed distributions across all teams at the event."""
-        from utils.constants import Criteria
-        teams = retrieve_team_list()
+    @st.cache_data(max_entries=2)
+    def _retrieve_throughput_distributions(_self, version: str) -> list:
+        """Retrieves numeric throughput speed distributions across all teams at the event.
+
+        :param version: The version of the scouting data (see `CalculatedStats.version`), which the cache is keyed on.
+        """
+        teams = retrieve_team_list(_self.calculated_stats.data)
         distributions = []
         for team in teams:
-            team_data = _self.calculated_stats.data[
-                _self.calculated_stats.data[Queries.TEAM_NUMBER] == team
-            ]
+            team_data = scouting_data_for_team(team, _self.calculated_stats.data)
             if team_data.empty:
                 distributions.append(Series(dtype=float))
                 continue
-            distributions.append(
-                team_data[Queries.THROUGHPUT_SPEED].apply(
-                    lambda v: Criteria.BASIC_RATING_CRITERIA.get(v, float("nan"))
-                ).dropna()
-            )
+            distributions.append(team_data[Queries.THROUGHPUT_SPEED_VALUE].dropna().astype(float))
         return distributions
 
     def generate_input_section(self) -> None:
@@ -76,11 +66,12 @@ class EventManager(PageManager):
         """Creates metrics showing average driver rating and throughput of the top 8, 16 and 24 teams."""
         top_8_col, top_16_col, top_24_col = st.columns(3)
 
-        teams = retrieve_team_list()
+        teams = retrieve_team_list(self.calculated_stats.data)
 
-        avg_driver_per_team = sorted(
-            [self.calculated_stats.average_driver_rating(team) for team in teams],
-            reverse=True
+        avg_driver_per_team = (
+            self.calculated_stats.team_table(teams)["average_driver_rating"]
+            .sort_values(ascending=False)
+            .tolist()
         )
 
         with top_8_col:
@@ -114,13 +105,13 @@ class EventManager(PageManager):
 
         :param type_of_graph: Unused; kept for API compatibility.
         """
-        teams = retrieve_team_list()
+        teams = retrieve_team_list(self.calculated_stats.data)
         driver_col, throughput_col = st.columns(2, gap="large")
 
         with driver_col:
             variable_key = "driver_rating_dist"
 
-            driver_distributions = self._retrieve_driver_rating_distributions()
+            driver_distributions = self._retrieve_driver_rating_distributions(self.calculated_stats.version)
             sorted_dist = dict(
                 sorted(
                     zip(teams, driver_distributions),
@@ -168,7 +159,7 @@ class EventManager(PageManager):
         with throughput_col:
             variable_key = "throughput_dist"
 
-            throughput_distributions = self._retrieve_throughput_distributions()
+            throughput_distributions = self._retrieve_throughput_distributions(self.calculated_stats.version)
             sorted_tp = dict(
                 sorted(
                     zip(teams, throughput_distributions),
@@ -2,26 +2,29 @@
 
 import numpy as np
 import streamlit as st
+from pandas import concat
 
 from .page_manager import PageManager
 from utils import (
     alliance_breakdown,
     bar_graph,
     box_plot,
-    CalculatedStats,
     colored_metric,
     Criteria,
     GeneralConstants,
     get_team_statbotics,
     GraphType,
+    matches_for_team,
     multi_line_graph,
+    option_counts,
     plotly_chart,
     populate_missing_data,
     Queries,
+    retrieve_match_data,
     retrieve_match_schedule,
     retrieve_team_list,
-    retrieve_scouting_data,
     scouting_data_for_team,
+    shared_calculated_stats,
     stacked_bar_graph,
     win_percentages,
 )
@@ -31,7 +34,7 @@ class MatchManager(PageManager):
     """The page manager for the `Match` page."""
 
     def __init__(self):
-        self.calculated_stats = CalculatedStats(retrieve_scouting_data())
+        self.calculated_stats = shared_calculated_stats()
 
     def generate_input_section(self) -> list[list, list]:
         """Creates the input section for the `Match` page.
@@ -42,21 +45,12 @@ class MatchManager(PageManager):
 
         filter_teams_col, match_selector_col = st.columns(2)
 
-        filter_by_team_number = str(
-            filter_teams_col.selectbox(
-                "Filter Matches by Team Number", ["—"] + retrieve_team_list()
-            )
+        filter_by_team_number = filter_teams_col.selectbox(
+            "Filter Matches by Team Number", ["—"] + retrieve_team_list()
         )
 
         if filter_by_team_number != "—":
-            match_schedule = match_schedule[
-                match_schedule["red_alliance"]
-                    .apply(lambda alliance: ",".join(map(str, alliance)))
-                    .str.contains(filter_by_team_number)
-                | match_schedule["blue_alliance"]
-                    .apply(lambda alliance: ",".join(map(str, alliance)))
-                    .str.contains(filter_by_team_number)
-                ]
+            match_schedule = matches_for_team(filter_by_team_number)
 
         match_chosen = match_selector_col.selectbox(
             "Choose Match", match_schedule["match_key"]
@@ -103,9 +97,9 @@ class MatchManager(PageManager):
         predicted_red_score_col, red_alliance_breakdown_col = st.columns(2)
         predicted_blue_score_col, blue_alliance_breakdown_col = st.columns(2)
 
-        odds_red, odds_blue, red_mean, blue_mean = self.calculated_stats.chance_of_winning(
-            red_alliance, blue_alliance
-        )
+        prediction = self.calculated_stats.predict_match(red_alliance, blue_alliance)
+        odds_red, odds_blue = prediction["red_win_chance"], prediction["blue_win_chance"]
+        red_mean, blue_mean = prediction["red_score"], prediction["blue_score"]
 
         with chance_of_winning_col:
             win_percentages(red_odds=odds_red, blue_odds=odds_blue)
@@ -152,6 +146,36 @@ class MatchManager(PageManager):
                 Queries.BLUE_ALLIANCE,
             )
 
+    def generate_upcoming_matches(self) -> None:
+        """Generates a table of the predicted outcomes of the matches that haven't been played yet."""
+        predictions = self.calculated_stats.predict_schedule()
+        match_data = retrieve_match_data()
+
+        if not match_data.empty:
+            predictions = predictions[~predictions["match_key"].isin(match_data["match_key"])]
+
+        if predictions.empty:
+            st.info("There are no upcoming matches left in the schedule.")
+            return
+
+        st.dataframe(
+            predictions[
+                ["match_key", "red_alliance", "blue_alliance", "red_win_chance", "red_score", "blue_score"]
+            ],
+            column_config={
+                "match_key": "Match",
+                "red_alliance": "Red Alliance",
+                "blue_alliance": "Blue Alliance",
+                "red_win_chance": st.column_config.ProgressColumn(
+                    "Red Win Chance", format="percent", min_value=0, max_value=1
+                ),
+                "red_score": st.column_config.NumberColumn("Predicted Red Score", format="%.1f"),
+                "blue_score": st.column_config.NumberColumn("Predicted Blue Score", format="%.1f"),
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
+
     def _best_to_defend(self, alliance: list[int]) -> int:
         """Returns the team on the alliance that is hardest to defend against (highest throughput / counter-defense ratio)."""
         rankings = sorted(
@@ -215,6 +239,7 @@ class MatchManager(PageManager):
         :param type_of_graph: Unused; kept for API compatibility.
         """
         combined_teams = red_alliance + blue_alliance
+        team_table = self.calculated_stats.team_table(combined_teams)
 
         driver_col, throughput_col = st.columns(2)
         intake_col, defense_col = st.columns(2)
@@ -225,7 +250,7 @@ class MatchManager(PageManager):
         with driver_col:
             plotly_chart(self._alliance_sorted_bar(
                 red_alliance, blue_alliance,
-                [self.calculated_stats.average_driver_rating(t) for t in combined_teams],
+                team_table["average_driver_rating"].tolist(),
                 x_axis_label="Team", y_axis_label="Avg. Driver Rating (1–5)",
                 title="Driver Rating Comparison",
                 red_color=_RED, blue_color=_BLUE,
@@ -234,7 +259,7 @@ class MatchManager(PageManager):
         with throughput_col:
             plotly_chart(self._alliance_sorted_bar(
                 red_alliance, blue_alliance,
-                [self.calculated_stats.average_throughput_speed(t) for t in combined_teams],
+                team_table["average_throughput_speed"].tolist(),
                 x_axis_label="Team", y_axis_label="Avg. Throughput (1–5)",
                 title="Throughput Speed Comparison",
                 red_color=_RED, blue_color=_BLUE,
@@ -243,7 +268,7 @@ class MatchManager(PageManager):
         with intake_col:
             plotly_chart(self._alliance_sorted_bar(
                 red_alliance, blue_alliance,
-                [self.calculated_stats.average_intake_speed_rating(t) for t in combined_teams],
+                team_table["average_intake_speed_rating"].tolist(),
                 x_axis_label="Team", y_axis_label="Avg. Intake Speed (1–5)",
                 title="Intake Speed Comparison",
                 red_color=_RED, blue_color=_BLUE,
@@ -252,7 +277,7 @@ class MatchManager(PageManager):
         with defense_col:
             plotly_chart(self._alliance_sorted_bar(
                 red_alliance, blue_alliance,
-                [self.calculated_stats.average_defense_rating(t) for t in combined_teams],
+                team_table["average_defense_rating"].tolist(),
                 x_axis_label="Team", y_axis_label="Avg. Defense (1–5)",
                 title="Defense Rating Comparison",
                 red_color=_RED, blue_color=_BLUE,
@@ -300,13 +325,11 @@ class MatchManager(PageManager):
         :param type_of_graph: Unused; kept for API compatibility.
         :param color_gradient: The color gradient depending on alliance.
         """
+        team_table = self.calculated_stats.team_table(team_numbers)
         auto_climb_col, auto_scoring_side_col = st.columns(2)
 
         with auto_climb_col:
-            auto_climb_rates = [
-                round(self.calculated_stats.auto_climb_rate(team) * 100, 1)
-                for team in team_numbers
-            ]
+            auto_climb_rates = (team_table["auto_climb_rate"] * 100).round(1).tolist()
             plotly_chart(bar_graph(
                 team_numbers, auto_climb_rates,
                 x_axis_label="Team", y_axis_label="Auto Climb Rate (%)",
@@ -316,19 +339,15 @@ class MatchManager(PageManager):
 
         with auto_scoring_side_col:
             # Aggregate all scoring sides across teams in the alliance
-            all_sides: dict[str, int] = {}
-            for team in team_numbers:
-                team_data = scouting_data_for_team(team)
-                for sides in team_data[Queries.AUTO_SCORING_SIDE]:
-                    if isinstance(sides, list):
-                        for s in sides:
-                            all_sides[s] = all_sides.get(s, 0) + 1
-
-            if all_sides:
-                sorted_sides = dict(sorted(all_sides.items(), key=lambda x: x[1], reverse=True))
+            alliance_data = concat(
+                [scouting_data_for_team(team, self.calculated_stats.data) for team in team_numbers]
+            )
+            side_counts = option_counts(alliance_data[Queries.AUTO_SCORING_SIDE_MASK], Criteria.SCORING_SIDE_OPTIONS)
+
+            if side_counts:
                 plotly_chart(bar_graph(
-                    list(sorted_sides.keys()),
-                    list(sorted_sides.values()),
+                    list(side_counts.keys()),
+                    list(side_counts.values()),
                     x_axis_label="Side", y_axis_label="# of Occurrences",
                     title="Auto Scoring Sides (Alliance)",
                     color=color_gradient[0]
@@ -348,7 +367,8 @@ class MatchManager(PageManager):
         :param type_of_graph: Unused; kept for API compatibility.
         :param color_gradient: The color gradient depending on alliance.
         """
-        teams_data = [scouting_data_for_team(team) for team in team_numbers]
+        teams_data = [scouting_data_for_team(team, self.calculated_stats.data) for team in team_numbers]
+        team_table = self.calculated_stats.team_table(team_numbers)
 
         st.write("## 🧗 Endgame")
         climb_breakdown_col, climb_speed_col = st.columns(2)
@@ -400,19 +420,13 @@ class MatchManager(PageManager):
             ))
 
         with teleop_side_col:
-            all_sides: dict[str, int] = {}
-            for team in team_numbers:
-                team_data = scouting_data_for_team(team)
-                for sides in team_data[Queries.TELEOP_SCORING_SIDE]:
-                    if isinstance(sides, list):
-                        for s in sides:
-                            all_sides[s] = all_sides.get(s, 0) + 1
-
-            if all_sides:
-                sorted_sides = dict(sorted(all_sides.items(), key=lambda x: x[1], reverse=True))
+            alliance_data = concat(teams_data)
+            side_counts = option_counts(alliance_data[Queries.TELEOP_SCORING_SIDE_MASK], Criteria.SCORING_SIDE_OPTIONS)
+
+            if side_counts:
                 plotly_chart(bar_graph(
-                    list(sorted_sides.keys()),
-                    list(sorted_sides.values()),
+                    list(side_counts.keys()),
+                    list(side_counts.values()),
                     x_axis_label="Side", y_axis_label="# of Occurrences",
                     title="Teleop Scoring Sides (Alliance)",
                     color=color_gradient[0]
@@ -421,10 +435,7 @@ class MatchManager(PageManager):
                 st.info("No teleop scoring side data.")
 
         with shoot_move_col:
-            sotm_rates = [
-                round(self.calculated_stats.shoot_on_the_move_rate(team) * 100, 1)
-                for team in team_numbers
-            ]
+            sotm_rates = (team_table["shoot_on_the_move_rate"] * 100).round(1).tolist()
             plotly_chart(bar_graph(
                 team_numbers, sotm_rates,
                 x_axis_label="Team", y_axis_label="Shoot-on-the-Move Rate (%)",
@@ -442,12 +453,11 @@ class MatchManager(PageManager):
         :param team_numbers: The teams to generate the graphs for.
         :param color_gradient: The color gradient depending on alliance.
         """
+        team_table = self.calculated_stats.team_table(team_numbers)
         driver_rating_col, throughput_col, disables_col = st.columns(3)
 
         with driver_rating_col:
-            driver_ratings = [
-                self.calculated_stats.average_driver_rating(team) for team in team_numbers
-            ]
+            driver_ratings = team_table["average_driver_rating"].tolist()
             plotly_chart(bar_graph(
                 team_numbers, driver_ratings,
                 x_axis_label="Teams", y_axis_label="Driver Rating (1–5)",
@@ -456,9 +466,7 @@ class MatchManager(PageManager):
             ))
 
         with throughput_col:
-            throughput_ratings = [
-                self.calculated_stats.average_throughput_speed(team) for team in team_numbers
-            ]
+            throughput_ratings = team_table["average_throughput_speed"].tolist()
             plotly_chart(bar_graph(
                 team_numbers, throughput_ratings,
                 x_axis_label="Teams", y_axis_label="Throughput Speed (1–5)",
@@ -467,10 +475,7 @@ class MatchManager(PageManager):
             ))
 
         with disables_col:
-            disable_rates = [
-                round(self.calculated_stats.disabled_rate(team) * 100, 1)
-                for team in team_numbers
-            ]
+            disable_rates = (team_table["disabled_rate"] * 100).round(1).tolist()
             plotly_chart(bar_graph(
                 team_numbers, disable_rates,
                 x_axis_label="Teams", y_axis_label="Disabled Rate (%)",
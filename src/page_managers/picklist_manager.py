@@ -1,16 +1,22 @@
 """Creates the `PicklistManager` class used to set up the Picklist page and its table."""
 
 import os
-from functools import partial
 
 import streamlit as st
 from dotenv import load_dotenv
 from notion_client import Client
-from notion_client.helpers import get_id
 from pandas import DataFrame, notna
 
 from .page_manager import PageManager
-from utils import CalculatedStats, Criteria, EventSpecificConstants, Queries, retrieve_scouting_data, retrieve_team_list
+from utils import (
+    EventSpecificConstants,
+    GeneralConstants,
+    NotionSync,
+    Queries,
+    retrieve_team_list,
+    scouting_data_for_team,
+    shared_calculated_stats
+)
 
 load_dotenv()
 
@@ -20,23 +26,25 @@ class PicklistManager(PageManager):
     TRUNCATE_AT_DIGIT = 2
 
     def __init__(self):
-        self.calculated_stats = CalculatedStats(
-            retrieve_scouting_data()
-        )
+        self.calculated_stats = shared_calculated_stats()
         self.teams = retrieve_team_list()
-        self.client = Client(auth=os.getenv("NOTION_TOKEN"))
+        self.client = Client(
+            auth=os.getenv("NOTION_TOKEN"),
+            base_url=os.getenv("NOTION_BASE_URL", GeneralConstants.NOTION_BASE_URL)
+        )
 
+        # Maps each picklist field to its column within `CalculatedStats.team_table`.
         self.requested_stats = {
-            "Avg. Driver Rating (1–5)": self.calculated_stats.average_driver_rating,
-            "Avg. Throughput Speed (1–5)": self.calculated_stats.average_throughput_speed,
-            "Avg. Intake Speed (1–5)": self.calculated_stats.average_intake_speed_rating,
-            "Avg. Defense Rating (1–5)": self.calculated_stats.average_defense_rating,
-            "Avg. Counter Defense (1–5)": self.calculated_stats.average_counter_defense_skill,
-            "Avg. Shooter Defense (1–5)": self.calculated_stats.average_shooter_defense_skill,
-            "Teleop Climb Rate": self.calculated_stats.teleop_climb_rate,
-            "Auto Climb Rate": self.calculated_stats.auto_climb_rate,
-            "Disabled Rate": self.calculated_stats.disabled_rate,
-            "Shoot-on-the-Move Rate": self.calculated_stats.shoot_on_the_move_rate,
+            "Avg. Driver Rating (1–5)": "average_driver_rating",
+            "Avg. Throughput Speed (1–5)": "average_throughput_speed",
+            "Avg. Intake Speed (1–5)": "average_intake_speed_rating",
+            "Avg. Defense Rating (1–5)": "average_defense_rating",
+            "Avg. Counter Defense (1–5)": "average_counter_defense_skill",
+            "Avg. Shooter Defense (1–5)": "average_shooter_defense_skill",
+            "Teleop Climb Rate": "teleop_climb_rate",
+            "Auto Climb Rate": "auto_climb_rate",
+            "Disabled Rate": "disabled_rate",
+            "Shoot-on-the-Move Rate": "shoot_on_the_move_rate",
         }
 
     def generate_input_section(self) -> list[str]:
@@ -55,56 +63,76 @@ class PicklistManager(PageManager):
 
         :param stats_requested: The names of the statistics to include.
         """
-        requested_picklist = [
+        team_table = self.calculated_stats.team_table(self.teams)
+
+        return DataFrame(
             {
-                "Team Number": f"FRC {team}"
+                "Team Number": [f"FRC {team}" for team in self.teams]
             } | {
-                stat_name: round(self.requested_stats[stat_name](team), self.TRUNCATE_AT_DIGIT)
+                stat_name: team_table[self.requested_stats[stat_name]].round(self.TRUNCATE_AT_DIGIT).to_numpy()
                 for stat_name in stats_requested
             }
-            for team in self.teams
+        )
+
+    @staticmethod
+    def _notes_blocks(heading: str, notes: list[str]) -> list[dict]:
+        """Creates the Notion blocks listing the notes of a team under a heading.
+
+        :param heading: The heading of the notes.
+        :param notes: The notes to list (empty notes are skipped).
+        :return: The heading and one bulleted block per note, or no blocks at all if there aren't any notes.
+        """
+        notes = [note for note in notes if note]
+        if not notes:
+            return []
+
+        return [
+            {
+                "object": "block",
+                "type": "heading_3",
+                "heading_3": {
+                    "rich_text": [{"text": {"content": heading, "link": None}}],
+                    "color": "default",
+                    "is_toggleable": False
+                }
+            }
+        ] + [
+            {
+                "type": "bulleted_list_item",
+                "bulleted_list_item": {
+                    "rich_text": [{"type": "text", "text": {"content": note, "link": None}}]
+                }
+            }
+            for note in notes
         ]
-        return DataFrame.from_dict(requested_picklist)
 
     def write_to_notion(self, dataframe: DataFrame) -> None:
         """Writes the picklist to a Notion database.
 
+        The payload of every team's page is built in a single pass over the picklist, then the pages are synced
+        in bulk by `NotionSync` (which lists the database once and writes pages concurrently within rate limits).
+
         :param dataframe: The dataframe containing all the statistics of each team.
         """
-        properties = {
-            "Team Name": {"title": {}}
-        } | {
-            column: {"number": {}} for column in dataframe.columns if column != "Team Number"
-        }
-        icon = {"type": "emoji", "emoji": "🗒️"}
-        self.client.databases.update(
-            database_id=(db_id := get_id(EventSpecificConstants.PICKLIST_URL)),
-            properties=properties,
-            icon=icon
+        stat_columns = [column for column in dataframe.columns if column != "Team Number"]
+        notion_sync = NotionSync(self.client, EventSpecificConstants.PICKLIST_URL, "Team Name")
+        notion_sync.update_schema(
+            {"Team Name": {"title": {}}} | {column: {"number": {}} for column in stat_columns},
+            icon={"type": "emoji", "emoji": "🗒️"}
         )
 
-        percentile_75 = self.calculated_stats.quantile_stat(
-            0.75, lambda self_, team: self_.average_driver_rating(team)
-        )
-        percentile_50 = self.calculated_stats.quantile_stat(
-            0.5, lambda self_, team: self_.average_driver_rating(team)
-        )
-        percentile_25 = self.calculated_stats.quantile_stat(
-            0.25, lambda self_, team: self_.average_driver_rating(team)
-        )
+        percentile_75 = self.calculated_stats.quantile_stat(0.75, "average_driver_rating")
+        percentile_50 = self.calculated_stats.quantile_stat(0.5, "average_driver_rating")
+        percentile_25 = self.calculated_stats.quantile_stat(0.25, "average_driver_rating")
 
-        for _, row in dataframe.iterrows():
-            team_name = row["Team Number"]
-            query_page = self.client.databases.query(
-                database_id=db_id,
-                filter={
-                    "property": "Team Name",
-                    "title": {"contains": team_name}
-                }
-            )
-            team_number = int(team_name.split()[1])
-            team_driver = self.calculated_stats.average_driver_rating(team_number)
+        team_names = dataframe["Team Number"].tolist()
+        team_numbers = [int(team_name.split()[1]) for team_name in team_names]
+        driver_ratings = self.calculated_stats.team_table(team_numbers)["average_driver_rating"].tolist()
+        pages = {}
 
+        for team_name, team_number, team_driver, stats in zip(
+            team_names, team_numbers, driver_ratings, dataframe[stat_columns].to_dict("records")
+        ):
             if team_driver > percentile_75:
                 emoji = "🔵"
             elif percentile_50 <= team_driver < percentile_75:
@@ -114,34 +142,7 @@ class PicklistManager(PageManager):
             else:
                 emoji = "🔴"
 
-            auto_notes = self.calculated_stats.stat_per_match(team_number, Queries.AUTO_NOTES)
-            teleop_notes = self.calculated_stats.stat_per_match(team_number, Queries.TELEOP_NOTES)
-            rating_notes = self.calculated_stats.stat_per_match(team_number, Queries.RATING_NOTES)
-
-            def _notes_block(heading: str, notes_series) -> list:
-                notes_list = [n for n in notes_series if n]
-                if not notes_list:
-                    return []
-                return [
-                    {
-                        "object": "block",
-                        "type": "heading_3",
-                        "heading_3": {
-                            "rich_text": [{"text": {"content": heading, "link": None}}],
-                            "color": "default",
-                            "is_toggleable": False
-                        }
-                    }
-                ] + [
-                    {
-                        "type": "bulleted_list_item",
-                        "bulleted_list_item": {
-                            "rich_text": [{"type": "text", "text": {"content": note, "link": None}}]
-                        }
-                    }
-                    for note in notes_list
-                ]
-
+            team_data = scouting_data_for_team(team_number, self.calculated_stats.data)
             children = (
                 [{
                     "object": "block",
@@ -152,34 +153,20 @@ class PicklistManager(PageManager):
                         "color": "default"
                     }
                 }]
-                + _notes_block("Autonomous Notes", auto_notes)
-                + _notes_block("Teleop Notes", teleop_notes)
-                + _notes_block("Rating Notes", rating_notes)
+                + self._notes_blocks("Autonomous Notes", team_data[Queries.AUTO_NOTES].tolist())
+                + self._notes_blocks("Teleop Notes", team_data[Queries.TELEOP_NOTES].tolist())
+                + self._notes_blocks("Rating Notes", team_data[Queries.RATING_NOTES].tolist())
             )
 
-            page_props = {
-                column: {
-                    "number": data if notna(
-                        data := dataframe[dataframe["Team Number"] == team_name][column].tolist()[0]
-                    ) else 0
-                }
-                for column in dataframe.columns if column != "Team Number"
-            } | {
-                "Team Name": {"id": "title", "title": [{"text": {"content": team_name}}]},
+            pages[team_name] = {
+                "icon": {"type": "emoji", "emoji": emoji},
+                "properties": {
+                    column: {"number": value if notna(value) else 0} for column, value in stats.items()
+                } | {
+                    "Team Name": {"id": "title", "title": [{"text": {"content": team_name}}]},
+                },
+                "children": children
             }
 
-            if not query_page["results"]:
-                self.client.pages.create(
-                    database_id=db_id,
-                    icon={"type": "emoji", "emoji": emoji},
-                    parent={"type": "database_id", "database_id": db_id},
-                    properties=page_props,
-                    children=children
-                )
-            else:
-                self.client.pages.update(
-                    page_id=query_page["results"][0]["id"],
-                    icon={"type": "emoji", "emoji": emoji},
-                    parent={"type": "database_id", "database_id": db_id},
-                    properties=page_props
-                )
+        created, updated = notion_sync.sync(pages)
+        st.success(f"Wrote the picklist to Notion ({created} pages created, {updated} pages updated).")
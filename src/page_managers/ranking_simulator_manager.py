@@ -1,29 +1,28 @@
 """Creates the `RankingSimulatorManager` class used to set up the Ranking Simulator page and its table."""
-from collections import defaultdict
-
+import numpy as np
 import streamlit as st
-from numpy import logical_and
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from .page_manager import PageManager
 from utils import (
-    CalculatedStats,
-    retrieve_match_data,
-    retrieve_match_schedule,
-    retrieve_scouting_data,
-    retrieve_team_list
+    Queries,
+    retrieve_match_data_with_version,
+    retrieve_team_matches,
+    retrieve_team_list,
+    shared_calculated_stats,
+    simulate_rankings
 )
 
 
 class RankingSimulatorManager(PageManager):
     """The ranking simulator page manager for the `Ranking Simulator` page."""
     MATCHES_TO_START_FROM = 12
+    SIMULATIONS = 10_000
+    SIMULATION_SEED = 4099
 
     def __init__(self):
-        self.calculated_stats = CalculatedStats(
-            retrieve_scouting_data()
-        )
-        self.matches_played = retrieve_match_data()
+        self.calculated_stats = shared_calculated_stats()
+        self.matches_version, self.matches_played = retrieve_match_data_with_version()
 
     def generate_input_section(self) -> str:
         """Generates the input section of the `Ranking Simulator` page."""
@@ -39,90 +38,108 @@ class RankingSimulatorManager(PageManager):
             )
         )
 
+    @staticmethod
+    @st.cache_data(max_entries=2)
+    def _ranking_history(
+        _matches_played: DataFrame, version: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Converts the matches played into cumulative RP, score and matches played per team by match number.
+
+        The matches are turned into a long-form table with one row per team per match, which is then summed up
+        per team and match number and accumulated, so the standings after any match are a single column.
+
+        :param _matches_played: The matches played at the event (from `retrieve_match_data`).
+        :param version: The version of the TBA match data (see `retrieve_match_data_with_version`), which the cache
+                        is keyed on.
+        :return: The sorted teams that have played, alongside their cumulative RPs, scores and matches played,
+                 each a (teams × last match number + 1) array where column N holds the totals after match N.
+        """
+        team_matches = concat(
+            [
+                DataFrame({
+                    "team": _matches_played[f"{alliance}_alliance"].str.split(","),
+                    "match_number": _matches_played["match_number"],
+                    "rp": _matches_played[f"{alliance}_alliance_rp"],
+                    "score": _matches_played[f"{alliance}_score"],
+                }).explode("team")
+                for alliance in (Queries.RED_ALLIANCE, Queries.BLUE_ALLIANCE)
+            ],
+            ignore_index=True
+        ).dropna(subset=["team"])
+
+        teams, team_positions = np.unique(team_matches["team"].astype(int).to_numpy(), return_inverse=True)
+        match_numbers = team_matches["match_number"].to_numpy(dtype=int)
+        shape = (len(teams), (match_numbers.max() + 1) if len(match_numbers) else 1)
+
+        cumulative = []
+        for values in (team_matches["rp"].to_numpy(dtype=float), team_matches["score"].to_numpy(dtype=float), 1.0):
+            per_match = np.zeros(shape)
+            np.add.at(per_match, (team_positions, match_numbers), values)
+            cumulative.append(per_match.cumsum(axis=1))
+
+        return teams, *cumulative
+
     def _generate_rankings(self, to_match: int) -> DataFrame:
-        """Generates the rankings for a team given the matches that are specified."""
-        rankings = []
-        for team in retrieve_team_list():
-            red_match_data_for_team = self.matches_played[
-                logical_and(
-                    self.matches_played["red_alliance"].str.contains(str(team)),
-                    self.matches_played["match_number"] <= to_match
-                )
-            ]
-            blue_match_data_for_team = self.matches_played[
-                logical_and(
-                    self.matches_played["blue_alliance"].str.contains(str(team)),
-                    self.matches_played["match_number"] <= to_match
-                )
-            ]
-
-            matches_played = len(red_match_data_for_team) + len(blue_match_data_for_team)
-            average_rps = (
-                red_match_data_for_team["red_alliance_rp"].sum() + blue_match_data_for_team["blue_alliance_rp"].sum()
-            ) / matches_played
-            average_match_score = (
-                red_match_data_for_team["red_score"].sum() + blue_match_data_for_team["blue_score"].sum()
-            ) / matches_played
-            rankings.append((team, average_rps, average_match_score, matches_played))  # Sort orders
-
-        return DataFrame(
-            sorted(rankings, key=lambda ranking: ranking[1:-1], reverse=True),
-            columns=("team", "rp", "match_score", "matches_played")
+        """Generates the rankings for every team given the matches played up to (and including) the match specified."""
+        teams, cumulative_rps, cumulative_scores, cumulative_matches = self._ranking_history(
+            self.matches_played, self.matches_version
         )
+        column = min(to_match, cumulative_rps.shape[1] - 1)
+
+        matches_played = cumulative_matches[:, column]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rankings = DataFrame({
+                "team": teams,
+                "rp": cumulative_rps[:, column] / matches_played,
+                "match_score": cumulative_scores[:, column] / matches_played,
+                "matches_played": matches_played.astype(int),
+            })
+
+        # Teams that have been scouted but haven't played yet are still part of the rankings.
+        if unplayed_teams := sorted(set(retrieve_team_list(self.calculated_stats.data)) - set(teams.tolist())):
+            rankings = concat(
+                [
+                    rankings,
+                    DataFrame({"team": unplayed_teams, "rp": np.nan, "match_score": np.nan, "matches_played": 0})
+                ],
+                ignore_index=True
+            )
+
+        return rankings.sort_values(["rp", "match_score"], ascending=False).reset_index(drop=True)
+
+    def _remaining_matches(self, to_match: int) -> DataFrame:
+        """Retrieves the qualification matches after the match requested alongside their predicted outcomes.
+
+        :param to_match: The last match number that has been played in the simulation.
+        :return: A dataframe of the remaining matches containing the columns needed by `simulate_rankings`.
+        """
+        predictions = self.calculated_stats.predict_schedule()
+        team_matches = retrieve_team_matches()
+        remaining_match_keys = team_matches.loc[
+            (team_matches["comp_level"] == "qm") & (team_matches["match_number"] > to_match), "match_key"
+        ].unique()
+        return predictions[predictions["match_key"].isin(remaining_match_keys)].reset_index(drop=True)
 
     def generate_simulated_rankings(self, to_match: int) -> None:
-        """Generates the simulated rankings up to the match number requested."""
-        rankings = self._generate_rankings(to_match)
-        match_schedule = retrieve_match_schedule()
-        simulated_rankings = defaultdict(lambda: [[], [], 0])
-
-        teams = retrieve_team_list()
-        progress_bar = st.progress(0, text="Crunching the simulations...")
-
-        for idx, team in enumerate(teams, start=1):
-            matches_for_team = match_schedule[
-                match_schedule["red_alliance"]
-                    .apply(lambda alliance: ",".join(map(str, alliance)))
-                    .str.contains(str(team))
-                | match_schedule["blue_alliance"]
-                    .apply(lambda alliance: ",".join(map(str, alliance)))
-                    .str.contains(str(team))
-            ]
-            matches_left_for_team = matches_for_team[
-                matches_for_team["match_key"].apply(
-                    lambda key: int(key.replace("qm", "").replace("sf", "").replace("f", "").replace("m1", "").replace("m2", "").replace("m3", ""))
-                ) >= to_match
-            ][matches_for_team["match_key"].str.contains("qm")]
-
-            for _, row in matches_left_for_team.iterrows():
-                alliance = row["red_alliance"] if team in row["red_alliance"] else row["blue_alliance"]
-                opposing_alliance = row["blue_alliance"] if team in row["red_alliance"] else row["red_alliance"]
-
-                chance_of_energized_rp, chance_of_supercharged_rp, chance_of_traversal_rp = self.calculated_stats.chance_of_bonuses(alliance)
-                chance_of_winning, _, score, __ = self.calculated_stats.chance_of_winning(alliance, opposing_alliance)
-
-                total_rps = chance_of_energized_rp + chance_of_supercharged_rp + chance_of_traversal_rp + chance_of_winning * 3
-                simulated_rankings[team][0].append(total_rps)
-                simulated_rankings[team][1].append(score)
-                simulated_rankings[team][2] += 1
-
-            progress_bar.progress(idx / len(teams), "Crunching the simulations...")
-
-        progress_bar.empty()
-
-        new_rankings = []
-
-        # Calculate new rankings with simulated rankings.
-        for team in teams:
-            _, rps, avg_match_score, matches_played = rankings[rankings["team"] == team].iloc[0]
-            total_matches_played = matches_played + simulated_rankings[team][2]
-            print(team, total_matches_played)
-            total_avg_rp = (rps * matches_played + sum(simulated_rankings[team][0])) / total_matches_played
-            total_avg_score = (avg_match_score * matches_played + sum(simulated_rankings[team][1])) / total_matches_played
-            new_rankings.append((team, total_avg_rp, total_avg_score))
-
-        ranking_df = DataFrame(
-            sorted(new_rankings, key=lambda ranking: ranking[1:], reverse=True),
-            columns=("Team", "Average Ranking Points", "Average Match Score")
+        """Simulates the rest of the qualification matches after the match requested and displays each team's ranks."""
+        simulated_rankings = simulate_rankings(
+            self._generate_rankings(to_match),
+            self._remaining_matches(to_match),
+            simulations=self.SIMULATIONS,
+            seed=self.SIMULATION_SEED
+        )
+
+        st.caption(f"Based on {self.SIMULATIONS:,} simulations of the remaining qualification matches.")
+        st.dataframe(
+            simulated_rankings,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Team": st.column_config.NumberColumn(format="%d"),
+                "Expected Average RP": st.column_config.NumberColumn(format="%.2f"),
+                "Average Rank": st.column_config.NumberColumn(format="%.1f"),
+                "P(#1 Seed)": st.column_config.ProgressColumn(min_value=0, max_value=1, format="percent"),
+                "P(Top 8 / Captain)": st.column_config.ProgressColumn(min_value=0, max_value=1, format="percent"),
+                "Rank Distribution": st.column_config.BarChartColumn(y_min=0, y_max=1),
+            }
         )
-        st.table(ranking_df.map(lambda value: f"{value:.2f}" if isinstance(value, float) else value))
@@ -3,9 +3,9 @@ import pandas as pd
 import streamlit as st
 from .page_manager import PageManager
 from utils import (
-    CalculatedStats,
     Queries,
     retrieve_scouting_data,
+    shared_calculated_stats,
 )
 from dotenv import load_dotenv
 from pandas import DataFrame
@@ -22,7 +22,7 @@ class ScoutingAccuracyManager(PageManager):
     """
 
     def __init__(self):
-        self.calculated_stats = CalculatedStats(retrieve_scouting_data())
+        self.calculated_stats = shared_calculated_stats()
         self.raw_scouting_data = retrieve_scouting_data()
 
     def generate_input_section(self) -> str:
@@ -1,31 +1,32 @@
 """Creates the `TeamManager` class used to set up the Teams page and its graphs."""
 
-import re
 import streamlit as st
 from annotated_text import annotated_text
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from pandas import isna
 
 from .contains_metrics import ContainsMetrics
 from .page_manager import PageManager
 from utils import (
+    annotate_notes,
     bar_graph,
     box_plot,
-    CalculatedStats,
     colored_metric,
+    colored_metric_with_two_values,
     Criteria,
+    EventSpecificConstants,
     GeneralConstants,
+    get_team_statbotics,
     GraphType,
     line_graph,
     multi_line_graph,
+    option_counts,
     plotly_chart,
+    populate_missing_data,
     Queries,
     retrieve_team_list,
-    retrieve_scouting_data,
     scouting_data_for_team,
+    shared_calculated_stats,
     stacked_bar_graph,
-    colored_metric_with_two_values,
-    populate_missing_data,
-    get_team_statbotics,
     statbotics_quantile,
 )
 
@@ -34,9 +35,7 @@ class TeamManager(PageManager, ContainsMetrics):
     """The page manager for the `Teams` page."""
 
     def __init__(self):
-        self.calculated_stats = CalculatedStats(
-            retrieve_scouting_data()
-        )
+        self.calculated_stats = shared_calculated_stats()
 
     def generate_input_section(self) -> int:
         """Creates the input section for the `Teams` page.
@@ -62,57 +61,51 @@ class TeamManager(PageManager, ContainsMetrics):
 
         with driver_rating_col:
             avg_driver = self.calculated_stats.average_driver_rating(team_number)
-            driver_percentile = self.calculated_stats.quantile_stat(
-                0.5, lambda self, team: self.average_driver_rating(team)
-            )
+            driver_percentile = self.calculated_stats.quantile_stat(0.5, "average_driver_rating")
             colored_metric(
                 "Avg. Driver Rating (1–5)",
                 round(avg_driver, 2),
                 threshold=driver_percentile
             )
+            self._percentile_caption(team_number, "average_driver_rating")
 
         with throughput_col:
             avg_throughput = self.calculated_stats.average_throughput_speed(team_number)
-            throughput_percentile = self.calculated_stats.quantile_stat(
-                0.5, lambda self, team: self.average_throughput_speed(team)
-            )
+            throughput_percentile = self.calculated_stats.quantile_stat(0.5, "average_throughput_speed")
             colored_metric(
                 "Avg. Throughput Speed (1–5)",
                 round(avg_throughput, 2),
                 threshold=throughput_percentile
             )
+            self._percentile_caption(team_number, "average_throughput_speed")
 
         pct_formatter = lambda v: f"{round(v * 100, 1)}%"
 
         with climb_rate_col:
             climb_rate = self.calculated_stats.teleop_climb_rate(team_number)
-            climb_rate_percentile = self.calculated_stats.quantile_stat(
-                0.5, lambda self, team: self.teleop_climb_rate(team)
-            )
+            climb_rate_percentile = self.calculated_stats.quantile_stat(0.5, "teleop_climb_rate")
             colored_metric(
                 "Teleop Climb Rate",
                 climb_rate,
                 threshold=climb_rate_percentile,
                 value_formatter=pct_formatter
             )
+            self._percentile_caption(team_number, "teleop_climb_rate")
 
         with auto_climb_col:
             auto_climb_rate = self.calculated_stats.auto_climb_rate(team_number)
-            auto_climb_percentile = self.calculated_stats.quantile_stat(
-                0.5, lambda self, team: self.auto_climb_rate(team)
-            )
+            auto_climb_percentile = self.calculated_stats.quantile_stat(0.5, "auto_climb_rate")
             colored_metric(
                 "Auto Climb Rate",
                 auto_climb_rate,
                 threshold=auto_climb_percentile,
                 value_formatter=pct_formatter
             )
+            self._percentile_caption(team_number, "auto_climb_rate")
 
         with disabled_col:
             disabled_rate = self.calculated_stats.disabled_rate(team_number)
-            disabled_percentile = self.calculated_stats.quantile_stat(
-                0.5, lambda self, team: self.disabled_rate(team)
-            )
+            disabled_percentile = self.calculated_stats.quantile_stat(0.5, "disabled_rate")
             colored_metric(
                 "Disabled Rate",
                 disabled_rate,
@@ -120,18 +113,29 @@ class TeamManager(PageManager, ContainsMetrics):
                 invert_threshold=True,
                 value_formatter=pct_formatter
             )
+            self._percentile_caption(team_number, "disabled_rate")
 
         with shoot_move_col:
             sotm_rate = self.calculated_stats.shoot_on_the_move_rate(team_number)
-            sotm_percentile = self.calculated_stats.quantile_stat(
-                0.5, lambda self, team: self.shoot_on_the_move_rate(team)
-            )
+            sotm_percentile = self.calculated_stats.quantile_stat(0.5, "shoot_on_the_move_rate")
             colored_metric(
                 "Shoot-on-the-Move Rate",
                 sotm_rate,
                 threshold=sotm_percentile,
                 value_formatter=pct_formatter
             )
+            self._percentile_caption(team_number, "shoot_on_the_move_rate")
+
+    def _percentile_caption(self, team_number: int, stat: str) -> None:
+        """Writes a caption containing the percentile of a team for a stat across the event.
+
+        :param team_number: The team to write the percentile of.
+        :param stat: The name of the per-team method in `CalculatedStats` (eg "average_driver_rating").
+        """
+        rank = self.calculated_stats.percentile_rank(team_number, stat)
+
+        if rank == rank:  # NaN check
+            st.caption(f"Percentile at {EventSpecificConstants.EVENT_NAME}: {round(rank * 100)}")
 
     def generate_quantitative_metrics(self, team_number: int) -> None:
         """Creates Statbotics EPA metrics for the `Teams` page.
@@ -194,18 +198,14 @@ class TeamManager(PageManager, ContainsMetrics):
         :param team_number: The team to generate the graphs for.
         :param type_of_graph: Unused; kept for API compatibility.
         """
-        scouting_data = scouting_data_for_team(team_number)
+        scouting_data = scouting_data_for_team(team_number, self.calculated_stats.data)
 
         auto_climb_col, scoring_side_col = st.columns(2)
         trench_bump_col, _ = st.columns(2)
 
         with auto_climb_col:
-            climb_counts = {"Climbed": 0, "Did Not Climb": 0}
-            for val in scouting_data[Queries.AUTO_CLIMB]:
-                if Criteria.BOOLEAN_CRITERIA.get(val, 0):
-                    climb_counts["Climbed"] += 1
-                else:
-                    climb_counts["Did Not Climb"] += 1
+            times_climbed = int(scouting_data[Queries.AUTO_CLIMB_FLAG].sum())
+            climb_counts = {"Climbed": times_climbed, "Did Not Climb": len(scouting_data) - times_climbed}
 
             plotly_chart(
                 bar_graph(
@@ -223,23 +223,13 @@ class TeamManager(PageManager, ContainsMetrics):
             )
 
         with scoring_side_col:
-            all_sides = []
-            for sides in scouting_data[Queries.AUTO_SCORING_SIDE]:
-                if isinstance(sides, list):
-                    all_sides.extend(sides)
-                elif isinstance(sides, str) and sides:
-                    all_sides.append(sides)
-
-            side_counts: dict[str, int] = {}
-            for side in all_sides:
-                side_counts[side] = side_counts.get(side, 0) + 1
+            side_counts = option_counts(scouting_data[Queries.AUTO_SCORING_SIDE_MASK], Criteria.SCORING_SIDE_OPTIONS)
 
             if side_counts:
-                sorted_sides = dict(sorted(side_counts.items(), key=lambda x: x[1], reverse=True))
                 plotly_chart(
                     bar_graph(
-                        list(sorted_sides.keys()),
-                        list(sorted_sides.values()),
+                        list(side_counts.keys()),
+                        list(side_counts.values()),
                         x_axis_label="Scoring Side",
                         y_axis_label="# of Occurrences",
                         title="Auto Scoring Sides",
@@ -250,23 +240,13 @@ class TeamManager(PageManager, ContainsMetrics):
                 st.info("No auto scoring side data available.")
 
         with trench_bump_col:
-            all_paths = []
-            for paths in scouting_data[Queries.AUTO_TRENCH_BUMP]:
-                if isinstance(paths, list):
-                    all_paths.extend(paths)
-                elif isinstance(paths, str) and paths:
-                    all_paths.append(paths)
-
-            path_counts: dict[str, int] = {}
-            for path in all_paths:
-                path_counts[path] = path_counts.get(path, 0) + 1
+            path_counts = option_counts(scouting_data[Queries.AUTO_TRENCH_BUMP_MASK], Criteria.TRENCH_BUMP_OPTIONS)
 
             if path_counts:
-                sorted_paths = dict(sorted(path_counts.items(), key=lambda x: x[1], reverse=True))
                 plotly_chart(
                     bar_graph(
-                        list(sorted_paths.keys()),
-                        list(sorted_paths.values()),
+                        list(path_counts.keys()),
+                        list(path_counts.values()),
                         x_axis_label="Path",
                         y_axis_label="# of Occurrences",
                         title="Auto Trench / Bump Usage",
@@ -286,7 +266,7 @@ class TeamManager(PageManager, ContainsMetrics):
         :param team_number: The team to generate the graphs for.
         :param type_of_graph: Unused; kept for API compatibility.
         """
-        scouting_data = scouting_data_for_team(team_number)
+        scouting_data = scouting_data_for_team(team_number, self.calculated_stats.data)
 
         climb_level_col, climb_speed_col = st.columns(2)
         scoring_side_col, trench_bump_col = st.columns(2)
@@ -339,23 +319,13 @@ class TeamManager(PageManager, ContainsMetrics):
                 st.info("No climb speed data recorded.")
 
         with scoring_side_col:
-            all_sides = []
-            for sides in scouting_data[Queries.TELEOP_SCORING_SIDE]:
-                if isinstance(sides, list):
-                    all_sides.extend(sides)
-                elif isinstance(sides, str) and sides:
-                    all_sides.append(sides)
-
-            side_counts: dict[str, int] = {}
-            for side in all_sides:
-                side_counts[side] = side_counts.get(side, 0) + 1
+            side_counts = option_counts(scouting_data[Queries.TELEOP_SCORING_SIDE_MASK], Criteria.SCORING_SIDE_OPTIONS)
 
             if side_counts:
-                sorted_sides = dict(sorted(side_counts.items(), key=lambda x: x[1], reverse=True))
                 plotly_chart(
                     bar_graph(
-                        list(sorted_sides.keys()),
-                        list(sorted_sides.values()),
+                        list(side_counts.keys()),
+                        list(side_counts.values()),
                         x_axis_label="Scoring Side",
                         y_axis_label="# of Occurrences",
                         title="Teleop Scoring Sides",
@@ -366,23 +336,13 @@ class TeamManager(PageManager, ContainsMetrics):
                 st.info("No teleop scoring side data available.")
 
         with trench_bump_col:
-            all_paths = []
-            for paths in scouting_data[Queries.TELEOP_TRENCH_BUMP]:
-                if isinstance(paths, list):
-                    all_paths.extend(paths)
-                elif isinstance(paths, str) and paths:
-                    all_paths.append(paths)
-
-            path_counts: dict[str, int] = {}
-            for path in all_paths:
-                path_counts[path] = path_counts.get(path, 0) + 1
+            path_counts = option_counts(scouting_data[Queries.TELEOP_TRENCH_BUMP_MASK], Criteria.TRENCH_BUMP_OPTIONS)
 
             if path_counts:
-                sorted_paths = dict(sorted(path_counts.items(), key=lambda x: x[1], reverse=True))
                 plotly_chart(
                     bar_graph(
-                        list(sorted_paths.keys()),
-                        list(sorted_paths.values()),
+                        list(path_counts.keys()),
+                        list(path_counts.values()),
                         x_axis_label="Path",
                         y_axis_label="# of Occurrences",
                         title="Teleop Trench / Bump Usage",
@@ -397,12 +357,7 @@ class TeamManager(PageManager, ContainsMetrics):
 
         :param team_number: The team to generate the graphs for.
         """
-        ml_weight = 1
-        estimate_weight = 1
-
-        sentiment = SentimentIntensityAnalyzer()
-        positivity_scores = []
-        scouting_data = scouting_data_for_team(team_number)
+        scouting_data = scouting_data_for_team(team_number, self.calculated_stats.data)
 
         qualitative_graphs_tab, note_scouting_analysis_tab = st.tabs(
             ["📊 Qualitative Graphs", "✏️ Note Scouting Analysis"]
@@ -517,23 +472,14 @@ class TeamManager(PageManager, ContainsMetrics):
                     color_indicator="Stability"
                 ))
 
-            # Robot style type breakdown (list field — flatten across all matches)
+            # Robot style type breakdown (multi-select field — count each option selected)
             st.divider()
             st.write("##### Robot Style Breakdown")
-            all_styles = []
-            for styles in scouting_data[Queries.ROBOT_STYLE_TYPE]:
-                if isinstance(styles, list):
-                    all_styles.extend(styles)
-                elif isinstance(styles, str) and styles:
-                    all_styles.append(styles)
-            style_counts: dict[str, int] = {}
-            for style in all_styles:
-                style_counts[style] = style_counts.get(style, 0) + 1
+            style_counts = option_counts(scouting_data[Queries.ROBOT_STYLE_TYPE_MASK], Criteria.ROBOT_STYLE_OPTIONS)
             if style_counts:
-                sorted_styles = dict(sorted(style_counts.items(), key=lambda x: x[1], reverse=True))
                 plotly_chart(bar_graph(
-                    list(sorted_styles.keys()),
-                    list(sorted_styles.values()),
+                    list(style_counts.keys()),
+                    list(style_counts.values()),
                     x_axis_label="Robot Style",
                     y_axis_label="# of Occurrences",
                     title="Robot Style Type Distribution",
@@ -544,16 +490,7 @@ class TeamManager(PageManager, ContainsMetrics):
 
         with note_scouting_analysis_tab:
             notes_col, metrics_col = st.columns(2, gap="medium")
-            notes_by_match = dict(
-                zip(
-                    scouting_data[Queries.MATCH_KEY],
-                    (
-                        scouting_data[Queries.AUTO_NOTES].apply(lambda n: (n + " ").lower() if n else "")
-                        + scouting_data[Queries.TELEOP_NOTES].apply(lambda n: (n + " ").lower() if n else "")
-                        + scouting_data[Queries.RATING_NOTES].apply(lambda n: n.lower() if n else "")
-                    )
-                )
-            )
+            notes_by_match = dict(zip(scouting_data[Queries.MATCH_KEY], scouting_data[Queries.NOTES]))
 
             with notes_col:
                 st.write("##### Notes")
@@ -563,37 +500,14 @@ class TeamManager(PageManager, ContainsMetrics):
                     if notes.strip():
                         notes_col.write(f"###### {match_key}")
 
-                        text_split_by_words = re.split(r"(\s+)", notes)
-                        annotated_words = []
-                        sentiment_scores = []
-
-                        for word in text_split_by_words:
-                            if not word.strip():
-                                annotated_words.append(word)
-                                continue
-
-                            if any(term in word.lower() for term in GeneralConstants.POSITIVE_TERMS):
-                                annotated_words.append((word, "", f"{GeneralConstants.LIGHT_GREEN}75"))
-                                sentiment_scores.append(1)
-                            elif any(term in word.lower() for term in GeneralConstants.NEGATIVE_TERMS):
-                                annotated_words.append((word, "", f"{GeneralConstants.LIGHT_RED}75"))
-                                sentiment_scores.append(-1)
-                            else:
-                                annotated_words.append(word)
-
-                        ml_generated_score = sentiment.polarity_scores(notes)["compound"]
-                        sentiment_estimate = sum(sentiment_scores) / (len(sentiment_scores) or 1)
-                        positivity_scores.append(
-                            (ml_generated_score * ml_weight + sentiment_estimate * estimate_weight) / 2
-                        )
-
-                        annotated_text(*annotated_words)
+                        annotated_text(*annotate_notes(notes))
                         st.markdown("<hr style='margin: 0px'/>", unsafe_allow_html=True)
 
             with metrics_col:
                 st.write("##### Metrics")
+                positivity = self.calculated_stats.team_table([team_number]).at[team_number, "average_notes_positivity"]
                 colored_metric(
                     "Positivity Score of Notes",
-                    round(sum(positivity_scores) / (len(positivity_scores) or 1), 2),
+                    round(0 if isna(positivity) else positivity, 2),
                     threshold=0
                 )
@@ -3,13 +3,14 @@
 import streamlit as st
 
 from page_managers import MatchManager
-from utils import GeneralConstants, GraphType
+from utils import GeneralConstants, GraphType, setup_page
 
 st.set_page_config(
     layout="wide",
     page_title="Match",
     page_icon="🏁",
 )
+setup_page()
 match_manager = MatchManager()
 
 if __name__ == '__main__':
@@ -17,8 +18,8 @@ if __name__ == '__main__':
 
     teams_selected = match_manager.generate_input_section()
 
-    comparison_tab, red_alliance_tab, blue_alliance_tab = st.tabs(
-        [":red[Red] vs. :blue[Blue]", ":red[Red Alliance]", ":blue[Blue Alliance]"]
+    comparison_tab, red_alliance_tab, blue_alliance_tab, upcoming_matches_tab = st.tabs(
+        [":red[Red] vs. :blue[Blue]", ":red[Red Alliance]", ":blue[Blue Alliance]", "📅 Upcoming Matches"]
     )
 
     with comparison_tab:
@@ -93,3 +94,7 @@ if __name__ == '__main__':
                 teams_selected[1],
                 color_gradient=GeneralConstants.BLUE_ALLIANCE_GRADIENT
             )
+
+    with upcoming_matches_tab:
+        st.write("### Upcoming Matches")
+        match_manager.generate_upcoming_matches()
@@ -3,13 +3,14 @@
 import streamlit as st
 
 from page_managers import MatchManager
-from utils import GeneralConstants, GraphType
+from utils import GeneralConstants, GraphType, setup_page
 
 st.set_page_config(
     layout="wide",
     page_title="Hypothetical Match",
     page_icon="🤔",
 )
+setup_page()
 match_manager = MatchManager()
 
 if __name__ == '__main__':
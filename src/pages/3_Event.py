@@ -3,13 +3,14 @@
 import streamlit as st
 
 from page_managers import EventManager
-from utils import GraphType
+from utils import GraphType, setup_page
 
 st.set_page_config(
     layout="wide",
     page_title="Event",
     page_icon="🏅",
 )
+setup_page()
 event_manager = EventManager()
 
 if __name__ == '__main__':
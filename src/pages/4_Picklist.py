@@ -2,6 +2,7 @@
 
 import streamlit as st
 from page_managers import PicklistManager
+from utils import setup_page
 
 # Configuration for Streamlit
 st.set_page_config(
@@ -9,6 +10,7 @@ st.set_page_config(
     page_title="Picklist",
     page_icon="🫂",
 )
+setup_page()
 picklist_manager = PicklistManager()
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 
 import streamlit as st
 from page_managers import CustomGraphsManager
+from utils import setup_page
 
 # Configuration for Streamlit
 st.set_page_config(
@@ -9,6 +10,7 @@ st.set_page_config(
     page_title="Custom Graphs",
     page_icon="📊",
 )
+setup_page()
 custom_graphs_manager = CustomGraphsManager()
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 
 import streamlit as st
 from page_managers import ScoutingAccuracyManager
+from utils import setup_page
 from pandas import DataFrame
 
 st.set_page_config(
@@ -9,6 +10,7 @@ st.set_page_config(
     page_title="Scouting Coverage",
     page_icon="🫂",
 )
+setup_page()
 scouting_accuracy_manager = ScoutingAccuracyManager()
 
 if __name__ == '__main__':
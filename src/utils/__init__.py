@@ -2,6 +2,11 @@ from .base_calculated_stats import *
 from .calculated_stats import *
 from .components import *
 from .constants import *
+from .fetching import *
 from .functions import *
 from .graphing import *
+from .note_analysis import *
+from .notion_sync import *
+from .ranking_simulation import *
+from .snapshot_store import *
 from .statbotics import *
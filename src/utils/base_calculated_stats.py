@@ -1,5 +1,6 @@
 """File that contains the class which calculates statistics for a team/event/for other purposes."""
 
+from math import floor
 from typing import Callable
 
 import numpy as np
@@ -14,20 +15,74 @@ class BaseCalculatedStats:
 
     def __init__(self, data: DataFrame):
         self.data = data
+        # Maps the name of a stat to the sorted values of that stat across every team (computed once per instance).
+        self._distributions: dict[str, np.ndarray] = {}
 
     # Percentile methods
-    def quantile_stat(self, quantile: float, predicate: Callable) -> float:
+    def quantile_stat(self, quantile: float, predicate: Callable | str) -> float:
         """Calculates a scalar value for a percentile of a dataset.
 
         Used for comparisons between teams (eg passing in 0.5 will return the median).
 
         :param quantile: Quantile used to find the scalar value at.
-        :param predicate: Predicate called per team in the scouting data to create the dataset (self and team number must be arguments).
+        :param predicate: Either the name of a per-team method (eg "average_driver_rating"), whose distribution is
+                          cached, or a predicate called per team in the scouting data to create the dataset
+                          (self and team number must be arguments).
         :return: A float representing the scalar value for a percentile of a dataset.
         """
+        if isinstance(predicate, str):
+            distribution = self.stat_distribution(predicate)
+
+            if not len(distribution):
+                return float("nan")
+
+            # Linearly interpolate between the closest ranks, the same way `numpy.percentile` does.
+            position = quantile * (len(distribution) - 1)
+            lower = floor(position)
+            upper = min(lower + 1, len(distribution) - 1)
+            return float(distribution[lower] + (distribution[upper] - distribution[lower]) * (position - lower))
+
         dataset = [predicate(self, team) for team in retrieve_team_list(self.data)]
         return percentile(dataset, quantile * 100)
 
+    def percentile_rank(self, team_number: int, stat: str) -> float:
+        """Calculates the fraction of teams at the event whose stat is less than or equal to a team's stat.
+
+        :param team_number: The team to calculate the percentile rank of.
+        :param stat: The name of the per-team method to rank the team by (eg "average_driver_rating").
+        :return: A float between 0 and 1, or NaN if the team has no value for the stat.
+        """
+        distribution = self.stat_distribution(stat)
+        value = getattr(self, stat)(team_number)
+
+        if not len(distribution) or value != value:  # NaN check
+            return float("nan")
+
+        return float(np.searchsorted(distribution, value, side="right") / len(distribution))
+
+    def stat_distribution(self, stat: str) -> np.ndarray:
+        """Returns the sorted values of a stat across every team at the event, ignoring missing values.
+
+        :param stat: The name of the per-team method to create the distribution for (eg "average_driver_rating").
+        :return: A sorted, read-only array containing one value per team (shared by every caller).
+        """
+        if stat not in self._distributions:
+            values = np.asarray(self._team_values(stat), dtype=float)
+            distribution = np.sort(values[~np.isnan(values)])
+            distribution.flags.writeable = False
+            self._distributions[stat] = distribution
+
+        return self._distributions[stat]
+
+    def _team_values(self, stat: str) -> list[float]:
+        """Calculates a stat for every team at the event.
+
+        :param stat: The name of the per-team method to call for each team.
+        :return: A list containing the stat for every team at the event.
+        """
+        method = getattr(self, stat)
+        return [method(team) for team in retrieve_team_list(self.data)]
+
     def calculate_iqr(self, dataset: Series) -> float:
         """Calculates the IQR of a dataset (75th percentile - 25th percentile).
 
@@ -2,28 +2,149 @@
 from __future__ import annotations
 
 from functools import reduce
-from typing import Callable
+from threading import Lock
 
 import numpy as np
-from numpy import percentile
-from pandas import DataFrame, Series, isna, to_numeric
-from scipy.integrate import quad
+from pandas import DataFrame, Series, isna, set_option, to_numeric
 from scipy.stats import norm
 
 
 from .base_calculated_stats import BaseCalculatedStats
-from .constants import Criteria, Queries
-from .functions import _convert_to_float_from_numpy_type, scouting_data_for_team, retrieve_team_list
-from .statbotics import get_team_statbotics
+from .constants import Queries
+from .functions import (
+    _convert_to_float_from_numpy_type,
+    retrieve_match_schedule_with_version,
+    retrieve_scouting_data_with_version,
+    scouting_data_for_team,
+    team_row_positions
+)
+from .ranking_simulation import BONUS_RPS
+from .statbotics import get_team_statbotics, retrieve_statbotics_data_with_version
 
-__all__ = ["CalculatedStats"]
+__all__ = ["CalculatedStats", "shared_calculated_stats"]
+
+# The version of the scouting data that the shared `CalculatedStats` instance was created from, alongside the instance.
+_SHARED_CALCULATED_STATS: tuple[str, CalculatedStats] | None = None
+_SHARED_CALCULATED_STATS_LOCK = Lock()
+
+
+def shared_calculated_stats() -> CalculatedStats:
+    """Retrieves the process-wide `CalculatedStats` instance for the latest scouting data.
+
+    Every session shares the same instance (and therefore the same scouting data and derived tables) until the
+    scouting data changes, at which point a new instance is created. The instance must be treated as read-only,
+    and copy-on-write is enabled so that dataframes derived from its data can't modify it.
+
+    :return: The shared `CalculatedStats` instance for the latest scouting data.
+    """
+    global _SHARED_CALCULATED_STATS
+
+    set_option("mode.copy_on_write", True)
+    version, scouting_data = retrieve_scouting_data_with_version()
+
+    with _SHARED_CALCULATED_STATS_LOCK:
+        if _SHARED_CALCULATED_STATS is None or _SHARED_CALCULATED_STATS[0] != version:
+            _SHARED_CALCULATED_STATS = (version, CalculatedStats(scouting_data, version))
+
+        return _SHARED_CALCULATED_STATS[1]
 
 
 class CalculatedStats(BaseCalculatedStats):
     """Utility class for calculating statistics in an event."""
 
-    def __init__(self, data: DataFrame):
+    # Columns of `team_table` that average a rating (1–5), alongside the encoded field they're averaged from.
+    AVERAGED_RATINGS = {
+        "average_driver_rating": Queries.DRIVER_RATING_VALUE,
+        "average_intake_speed_rating": Queries.INTAKE_SPEED_VALUE,
+        "average_defense_rating": Queries.DEFENSE_RATING_VALUE,
+        "average_counter_defense_skill": Queries.INTAKE_DEFENSE_RATING_VALUE,
+        "average_throughput_speed": Queries.THROUGHPUT_SPEED_VALUE,
+        "average_shooter_defense_skill": Queries.SHOOTER_DEFENSE_RATING_VALUE,
+    }
+    # Columns of `team_table` that average a per-match score, alongside the encoded field they're averaged from.
+    AVERAGED_SCORES = {
+        "average_notes_positivity": Queries.NOTES_POSITIVITY,
+    }
+    # Columns of `team_table` that are the fraction of matches a team did something in (0–1), alongside their flag.
+    RATES = {
+        "auto_climb_rate": Queries.AUTO_CLIMB_FLAG,
+        "teleop_climb_rate": Queries.TELEOP_CLIMB_FLAG,
+        "disabled_rate": Queries.DISABLE_FLAG,
+        "shoot_on_the_move_rate": Queries.SHOOT_ON_THE_MOVE_FLAG,
+    }
+
+    def __init__(self, data: DataFrame, version: str | None = None):
+        """Creates the statistics calculator for some scouting data.
+
+        :param data: The scouting data to calculate statistics from.
+        :param version: The version of the scouting data (see `retrieve_scouting_data_with_version`), which caches
+                        of anything derived from this instance's data should be keyed on.
+        """
         super().__init__(data)
+        self.version = version
+        # Index the submissions by team once so every per-team lookup is a dictionary access.
+        team_row_positions(self.data)
+        self._team_table: DataFrame | None = None
+        self._composite_stats: DataFrame | None = None
+        self._schedule_predictions: tuple[tuple[str, str], DataFrame] | None = None
+
+    # --- Event-wide team table ---
+
+    def team_table(self, teams: list[int] | None = None) -> DataFrame:
+        """Returns every per-team average rating, average score and rate for the teams at the event (ignore).
+
+        The table is computed for all teams in a single groupby pass the first time it's requested and is
+        reused afterwards, so it's computed once per version of the scouting data.
+
+        :param teams: An optional list of teams to restrict (and order) the table to. Teams without any
+                      submissions have NaN ratings and rates of 0.
+        :return: A dataframe indexed by team number with one column per rating/rate method (eg `average_driver_rating`).
+                 The dataframe is a copy, so modifying it never changes the table shared by every session.
+        """
+        if teams is None:
+            return self._shared_team_table().copy()
+
+        return self._shared_team_table().reindex(teams).fillna({rate: 0.0 for rate in self.RATES})
+
+    def _shared_team_table(self) -> DataFrame:
+        """Retrieves the table within `team_table` shared by every session, computing it the first time.
+
+        :return: The shared table, which must never be modified.
+        """
+        if self._team_table is None:
+            self._team_table = self._compute_team_table()
+
+        return self._team_table
+
+    def _compute_team_table(self) -> DataFrame:
+        """Computes the averages and rates within `team_table` for all teams in one pass.
+
+        :return: A dataframe indexed by team number with one column per rating/rate method.
+        """
+        encodings = {**self.AVERAGED_RATINGS, **self.AVERAGED_SCORES, **self.RATES}
+        columns = list(encodings)
+
+        if self.data.empty:
+            return DataFrame(columns=columns, dtype=float)
+
+        per_match = self.data[list(encodings.values())].astype(float)
+        per_match.columns = columns
+
+        return per_match.groupby(self.data[Queries.TEAM_NUMBER]).mean()
+
+    def _team_table_value(self, team_number: int, column: str) -> float:
+        """Looks up a single team's value within `team_table`.
+
+        :param team_number: The team to look up.
+        :param column: The column within `team_table` to look up.
+        :return: The value of the team, NaN for ratings and 0 for rates if the team has no submissions.
+        """
+        table = self._shared_team_table()
+
+        if team_number not in table.index:
+            return 0.0 if column in self.RATES else float("nan")
+
+        return table.at[team_number, column]
 
     # --- Rating methods ---
 
@@ -33,9 +154,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to determine the driver rating for.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.DRIVER_RATING].apply(
-            lambda v: Criteria.DRIVER_RATING_CRITERIA.get(v, float("nan"))
-        ).mean()
+        return self._team_table_value(team_number, "average_driver_rating")
 
     @_convert_to_float_from_numpy_type
     def average_intake_speed_rating(self, team_number: int) -> float:
@@ -43,9 +162,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to determine the intake speed rating for.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.INTAKE_SPEED].apply(
-            lambda v: Criteria.INTAKE_SPEED_CRITERIA.get(v, float("nan"))
-        ).mean()
+        return self._team_table_value(team_number, "average_intake_speed_rating")
 
     @_convert_to_float_from_numpy_type
     def average_defense_rating(self, team_number: int) -> float:
@@ -53,9 +170,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to find defense data for.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.DEFENSE_RATING].apply(
-            lambda v: Criteria.BASIC_RATING_CRITERIA.get(v, float("nan"))
-        ).mean()
+        return self._team_table_value(team_number, "average_defense_rating")
 
     @_convert_to_float_from_numpy_type
     def average_counter_defense_skill(self, team_number: int) -> float:
@@ -63,9 +178,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to determine the counter defense skill for.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.INTAKE_DEFENSE_RATING].apply(
-            lambda v: Criteria.BASIC_RATING_CRITERIA.get(v, float("nan"))
-        ).mean()
+        return self._team_table_value(team_number, "average_counter_defense_skill")
 
     @_convert_to_float_from_numpy_type
     def average_throughput_speed(self, team_number: int) -> float:
@@ -73,9 +186,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to determine the throughput for.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.THROUGHPUT_SPEED].apply(
-            lambda v: Criteria.BASIC_RATING_CRITERIA.get(v, float("nan"))
-        ).mean()
+        return self._team_table_value(team_number, "average_throughput_speed")
 
     @_convert_to_float_from_numpy_type
     def average_shooter_defense_skill(self, team_number: int) -> float:
@@ -83,9 +194,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to determine the shooter defense skill for.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.SHOOTER_DEFENSE_RATING].apply(
-            lambda v: Criteria.BASIC_RATING_CRITERIA.get(v, float("nan"))
-        ).mean()
+        return self._team_table_value(team_number, "average_shooter_defense_skill")
 
     # --- Rate/count methods ---
 
@@ -95,13 +204,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to compute the auto climb rate for.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
-        if team_data.empty:
-            return 0.0
-        values = team_data[Queries.AUTO_CLIMB].apply(
-            lambda v: Criteria.BOOLEAN_CRITERIA.get(v, 0)
-        )
-        return float(values.mean())
+        return self._team_table_value(team_number, "auto_climb_rate")
 
     @_convert_to_float_from_numpy_type
     def teleop_climb_rate(self, team_number: int) -> float:
@@ -109,13 +212,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to compute the teleop climb rate for.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
-        if team_data.empty:
-            return 0.0
-        values = team_data[Queries.TELEOP_CLIMB].apply(
-            lambda v: 0 if v in (None, "No climb") else 1
-        )
-        return float(values.mean())
+        return self._team_table_value(team_number, "teleop_climb_rate")
 
     @_convert_to_float_from_numpy_type
     def disabled_rate(self, team_number: int) -> float:
@@ -123,13 +220,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to compute the disabled rate for.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
-        if team_data.empty:
-            return 0.0
-        values = team_data[Queries.DISABLE].apply(
-            lambda v: Criteria.BOOLEAN_CRITERIA.get(v, 0)
-        )
-        return float(values.mean())
+        return self._team_table_value(team_number, "disabled_rate")
 
     @_convert_to_float_from_numpy_type
     def shoot_on_the_move_rate(self, team_number: int) -> float:
@@ -137,13 +228,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team to compute the shoot-on-the-move rate for.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
-        if team_data.empty:
-            return 0.0
-        values = team_data[Queries.SHOOT_ON_THE_MOVE].apply(
-            lambda v: Criteria.BOOLEAN_CRITERIA.get(v, 0)
-        )
-        return float(values.mean())
+        return self._team_table_value(team_number, "shoot_on_the_move_rate")
 
     # --- Composite scoring proxy (used for win probability) ---
 
@@ -159,36 +244,51 @@ class CalculatedStats(BaseCalculatedStats):
         if team_data.empty:
             return Series(dtype=float)
 
-        driver = team_data[Queries.DRIVER_RATING].apply(
-            lambda v: Criteria.DRIVER_RATING_CRITERIA.get(v, 3.0)
-        )
-        throughput = team_data[Queries.THROUGHPUT_SPEED].apply(
-            lambda v: Criteria.BASIC_RATING_CRITERIA.get(v, 3.0)
-        )
-        intake = team_data[Queries.INTAKE_SPEED].apply(
-            lambda v: Criteria.INTAKE_SPEED_CRITERIA.get(v, 3.0)
-        )
-        climb = team_data[Queries.TELEOP_CLIMB].apply(
-            lambda v: Criteria.CLIMBING_CRITERIA.get(v, 0) * 2.0
-        )
-        auto_climb = team_data[Queries.AUTO_CLIMB].apply(
-            lambda v: Criteria.BOOLEAN_CRITERIA.get(v, 0) * 3.0
-        )
+        return self._composite_scores(team_data).reset_index(drop=True)
 
-        return (driver * 2 + throughput * 3 + intake * 1 + climb + auto_climb).reset_index(drop=True)
+    @staticmethod
+    def _composite_scores(data: DataFrame) -> Series:
+        """Computes the composite proxy score of every submission within the scouting data passed in.
 
-    # --- Percentile methods ---
+        :param data: The scouting data to compute the composite scores for.
+        :return: A series containing one composite score per row of the data passed in.
+        """
+        driver = data[Queries.DRIVER_RATING_VALUE].fillna(3.0)
+        throughput = data[Queries.THROUGHPUT_SPEED_VALUE].fillna(3.0)
+        intake = data[Queries.INTAKE_SPEED_VALUE].fillna(3.0)
+        climb = data[Queries.TELEOP_CLIMB_LEVEL] * 2.0
+        auto_climb = data[Queries.AUTO_CLIMB_FLAG] * 3.0
 
-    def quantile_stat(self, quantile: float, predicate: Callable) -> float:
-        """Calculates a scalar value for a percentile of a dataset.
+        return (driver * 2 + throughput * 3 + intake * 1 + climb + auto_climb).astype(float)
 
-        Used for comparisons between teams (e.g. passing 0.5 returns the median).
+    def _composite_team_stats(self) -> DataFrame:
+        """Returns the mean and (population) standard deviation of every team's composite scores.
 
-        :param quantile: Quantile used to find the scalar value at.
-        :param predicate: Predicate called per team (self and team number must be arguments).
+        :return: A dataframe indexed by team number with `mean` and `std` columns, computed once per instance.
         """
-        dataset = [predicate(self, team) for team in retrieve_team_list()]
-        return percentile(dataset, quantile * 100)
+        if self._composite_stats is None:
+            if self.data.empty:
+                self._composite_stats = DataFrame(columns=["mean", "std"], dtype=float)
+            else:
+                grouped_scores = self._composite_scores(self.data).groupby(self.data[Queries.TEAM_NUMBER])
+                self._composite_stats = DataFrame(
+                    {"mean": grouped_scores.mean(), "std": grouped_scores.std(ddof=0)}
+                )
+
+        return self._composite_stats
+
+    # --- Percentile methods ---
+
+    def _team_values(self, stat: str) -> list[float]:
+        """Calculates a stat for every team at the event, reading it straight from `team_table` when possible.
+
+        :param stat: The name of the per-team method to call for each team.
+        :return: A list containing the stat for every team at the event.
+        """
+        if stat in (table := self._shared_team_table()).columns:
+            return table[stat].tolist()
+
+        return super()._team_values(stat)
 
     # --- General stat methods ---
 
@@ -241,75 +341,197 @@ class CalculatedStats(BaseCalculatedStats):
     # --- Bonus RP estimation (qualitative proxy) ---
 
     def chance_of_bonuses(self, alliance: list[int]) -> tuple[float, float, float]:
-        """Estimates bonus RP chances from qualitative data.
+        """Estimates bonus RP chances from qualitative data (thin wrapper around `chance_of_bonuses_batch`).
+
+        :param alliance: The three teams on the alliance.
+        """
+        return tuple(float(chance) for chance in self.chance_of_bonuses_batch([alliance])[0])
+
+    def chance_of_bonuses_batch(self, alliances: list[list[int]]) -> np.ndarray:
+        """Estimates bonus RP chances from qualitative data for many alliances at once.
 
         Since the dataset has no quantitative scores, returns simplified estimates:
         - Scoring RP proxy: average of throughput ratings across alliance / 5
         - Supercharged RP proxy: 0 (insufficient data to estimate)
         - Traversal RP proxy: average teleop climb rate across alliance
 
-        :param alliance: The three teams on the alliance.
+        :param alliances: The teams on every alliance (one row per alliance).
+        :return: An array with one row per alliance containing its scoring, supercharged and traversal RP chances.
         """
-        throughput_rates = [self.average_throughput_speed(team) for team in alliance]
-        avg_throughput = sum(t for t in throughput_rates if not (t != t)) / max(len(throughput_rates), 1)
-        chance_scoring_rp = min(avg_throughput / 5.0, 1.0)
+        if not len(alliances):
+            return np.empty((0, 3))
+
+        alliances = np.asarray(alliances, dtype=int).reshape(len(alliances), -1)
+        teams, positions = np.unique(alliances, return_inverse=True)
+        positions = positions.reshape(alliances.shape)
+        team_table = self.team_table(teams.tolist())
 
-        climb_rates = [self.teleop_climb_rate(team) for team in alliance]
-        avg_climb_rate = sum(climb_rates) / max(len(climb_rates), 1)
+        # Teams without a throughput rating count as 0 towards the alliance's average
+        throughput = np.nan_to_num(team_table["average_throughput_speed"].to_numpy(dtype=float))[positions]
+        chance_scoring_rp = np.minimum(throughput.mean(axis=1) / 5.0, 1.0)
+        chance_traversal_rp = team_table["teleop_climb_rate"].to_numpy(dtype=float)[positions].mean(axis=1)
 
-        return (chance_scoring_rp, 0.0, avg_climb_rate)
+        return np.column_stack([chance_scoring_rp, np.zeros(len(alliances)), chance_traversal_rp])
 
     # --- Win probability (Statbotics EPA-based) ---
 
     def chance_of_winning(self, alliance_one: list[int], alliance_two: list[int]) -> tuple:
-        """Returns the estimated win probability between two alliances.
-
-        Uses Statbotics EPA mean and standard deviation per team to model each
-        alliance's score as a normal distribution, then integrates to find the
-        probability that alliance one outscores alliance two.  Falls back to the
-        qualitative composite proxy when no Statbotics data is available.
+        """Returns the estimated win probability between two alliances (thin wrapper around `chance_of_winning_batch`).
 
         :param alliance_one: Three-team list for alliance one (red).
         :param alliance_two: Three-team list for alliance two (blue).
+        :return: The odds of alliance one winning, the odds of alliance two winning and both alliances' predicted scores.
         """
-        def _epa_stats(team: int) -> tuple[float, float]:
-            data = get_team_statbotics(team)
-            mean = float(data.get("total_epa") or 0)
-            sd   = float(data.get("total_epa_sd") or 0)
-            return mean, sd
-
-        a1_stats = [_epa_stats(t) for t in alliance_one]
-        a2_stats = [_epa_stats(t) for t in alliance_two]
-
-        if all(m == 0 for m, _ in a1_stats + a2_stats):
-            # No Statbotics data — fall back to qualitative composite scores
-            a1_series = [self.composite_score_by_match(t) for t in alliance_one]
-            a2_series = [self.composite_score_by_match(t) for t in alliance_two]
-            alliance_one_mean = sum(float(np.mean(s)) for s in a1_series if len(s))
-            alliance_two_mean = sum(float(np.mean(s)) for s in a2_series if len(s))
-            alliance_one_std  = sum(float(np.std(s)) ** 2 for s in a1_series) ** 0.5
-            alliance_two_std  = sum(float(np.std(s)) ** 2 for s in a2_series) ** 0.5
-        else:
-            alliance_one_mean = sum(m for m, _ in a1_stats)
-            alliance_two_mean = sum(m for m, _ in a2_stats)
-
-            def _sd(mean: float, sd: float) -> float:
-                # If API returned a valid SD use it; otherwise estimate ~15% of mean
-                return sd if sd > 0 else max(abs(mean) * 0.15, 5.0)
-
-            alliance_one_std = sum(_sd(m, s) ** 2 for m, s in a1_stats) ** 0.5
-            alliance_two_std = sum(_sd(m, s) ** 2 for m, s in a2_stats) ** 0.5
-
-        compared_mean = alliance_one_mean - alliance_two_mean
-        compared_std  = (alliance_one_std ** 2 + alliance_two_std ** 2) ** 0.5
-
-        if not compared_std and compared_mean:
-            compared_std = abs(compared_mean)
-        elif not compared_std:
-            compared_std = 0.5
-
-        dist = norm(loc=compared_mean, scale=compared_std)
-        odds_of_one_winning = quad(lambda x: dist.pdf(x), 0, np.inf)[0]
-        odds_of_two_winning = quad(lambda x: dist.pdf(x), -np.inf, 0)[0]
-
-        return odds_of_one_winning, odds_of_two_winning, alliance_one_mean, alliance_two_mean
+        return tuple(
+            float(result[0])
+            for result in self.chance_of_winning_batch([alliance_one], [alliance_two])
+        )
+
+    def chance_of_winning_batch(
+            self,
+            red_alliances: list[list[int]],
+            blue_alliances: list[list[int]],
+            statbotics_data: dict[str, dict] | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the estimated win probabilities for many matchups at once.
+
+        Uses Statbotics EPA mean and standard deviation per team to model each
+        alliance's score as a normal distribution, so the probability that the red
+        alliance outscores the blue alliance is the normal CDF of the difference in
+        means.  Matchups without any Statbotics data fall back to the qualitative
+        composite proxy.
+
+        :param red_alliances: The teams on the red alliance of every matchup (one row per matchup).
+        :param blue_alliances: The teams on the blue alliance of every matchup (one row per matchup).
+        :param statbotics_data: An optional snapshot of the Statbotics data to read EPAs from (the latest data
+                                is read otherwise).
+        :return: Arrays of the red alliances' odds of winning, the blue alliances' odds of winning, and the
+                 predicted red and blue scores, with one element per matchup.
+        """
+        if not len(red_alliances):
+            return tuple(np.empty(0) for _ in range(4))
+
+        red_alliances = np.asarray(red_alliances, dtype=int).reshape(len(red_alliances), -1)
+        blue_alliances = np.asarray(blue_alliances, dtype=int).reshape(len(blue_alliances), -1)
+
+        # Look every team up once and map each alliance slot to its team's position in the lookups.
+        teams, positions = np.unique(np.concatenate([red_alliances, blue_alliances], axis=1), return_inverse=True)
+        positions = positions.reshape(len(red_alliances), -1)
+        split = red_alliances.shape[1]  # Columns before this belong to the red alliance, the rest to the blue alliance
+
+        epa = [
+            get_team_statbotics(team) if statbotics_data is None else statbotics_data.get(str(team), {})
+            for team in teams
+        ]
+        epa_means = np.array([float(data.get("total_epa") or 0) for data in epa])
+        epa_sds = np.array([float(data.get("total_epa_sd") or 0) for data in epa])
+        # If the API didn't return a valid SD, estimate it as ~15% of the mean
+        epa_sds = np.where(epa_sds > 0, epa_sds, np.maximum(np.abs(epa_means) * 0.15, 5.0))
+
+        composite_stats = self._composite_team_stats().reindex(teams).fillna(0.0)
+        composite_means = composite_stats["mean"].to_numpy()
+        composite_sds = composite_stats["std"].to_numpy()
+
+        # No Statbotics data for any team in a matchup — fall back to qualitative composite scores
+        use_composite = (epa_means[positions] == 0).all(axis=1, keepdims=True)
+        means = np.where(use_composite, composite_means[positions], epa_means[positions])
+        variances = np.where(use_composite, composite_sds[positions], epa_sds[positions]) ** 2
+
+        red_mean = means[:, :split].sum(axis=1)
+        blue_mean = means[:, split:].sum(axis=1)
+
+        compared_mean = red_mean - blue_mean
+        compared_std = np.sqrt(variances.sum(axis=1))
+        compared_std = np.where(
+            compared_std > 0,
+            compared_std,
+            np.where(compared_mean != 0, np.abs(compared_mean), 0.5)
+        )
+
+        odds_of_red_winning = norm.sf(0, loc=compared_mean, scale=compared_std)
+        odds_of_blue_winning = norm.cdf(0, loc=compared_mean, scale=compared_std)
+
+        return odds_of_red_winning, odds_of_blue_winning, red_mean, blue_mean
+
+    # --- Match predictions ---
+
+    def predict_schedule(self) -> DataFrame:
+        """Predicts the outcome of every match in the match schedule (ignore).
+
+        Every match is scored exactly once per version of the scouting data, match schedule and Statbotics data,
+        so the ranking simulator and the match pages can all read from the same predictions.
+
+        :return: The match schedule with the `red_win_chance`/`blue_win_chance` of each match, the
+                 `red_score`/`blue_score` predicted for each alliance and a `{alliance}_{bonus}_rp_chance`
+                 column for every bonus RP.
+        """
+        schedule_version, match_schedule = retrieve_match_schedule_with_version()
+        statbotics_version, statbotics_data = retrieve_statbotics_data_with_version()
+        version = (schedule_version, statbotics_version)
+
+        if self._schedule_predictions is None or self._schedule_predictions[0] != version:
+            self._schedule_predictions = (
+                version,
+                self._predict_matches(
+                    match_schedule["red_alliance"].tolist(),
+                    match_schedule["blue_alliance"].tolist(),
+                    match_schedule[["match_key"]],
+                    statbotics_data
+                )
+            )
+
+        return self._schedule_predictions[1]
+
+    def predict_match(self, red_alliance: list[int], blue_alliance: list[int]) -> Series:
+        """Predicts the outcome of a single match, reading it from `predict_schedule` when the match is scheduled.
+
+        :param red_alliance: The three teams on the red alliance.
+        :param blue_alliance: The three teams on the blue alliance.
+        :return: A series with the same fields as a row of `predict_schedule`.
+        """
+        predictions = self.predict_schedule()
+        scheduled = predictions[
+            (predictions["red_alliance"].map(tuple) == tuple(red_alliance))
+            & (predictions["blue_alliance"].map(tuple) == tuple(blue_alliance))
+        ]
+
+        if not scheduled.empty:
+            return scheduled.iloc[0]
+
+        return self._predict_matches([list(red_alliance)], [list(blue_alliance)]).iloc[0]
+
+    def _predict_matches(
+            self,
+            red_alliances: list[list[int]],
+            blue_alliances: list[list[int]],
+            matches: DataFrame | None = None,
+            statbotics_data: dict[str, dict] | None = None
+    ) -> DataFrame:
+        """Predicts the win chances, scores and bonus RP chances of many matches at once.
+
+        :param red_alliances: The teams on the red alliance of every match.
+        :param blue_alliances: The teams on the blue alliance of every match.
+        :param matches: An optional dataframe (one row per match) that the predictions are added to.
+        :param statbotics_data: An optional snapshot of the Statbotics data to predict from (see
+                                `chance_of_winning_batch`).
+        :return: A dataframe with one row per match containing the alliances and their predictions.
+        """
+        red_odds, blue_odds, red_scores, blue_scores = self.chance_of_winning_batch(
+            red_alliances, blue_alliances, statbotics_data
+        )
+        red_bonuses = self.chance_of_bonuses_batch(red_alliances)
+        blue_bonuses = self.chance_of_bonuses_batch(blue_alliances)
+
+        if matches is None:
+            matches = DataFrame(index=range(len(red_alliances)))
+
+        return matches.reset_index(drop=True).assign(
+            red_alliance=red_alliances,
+            blue_alliance=blue_alliances,
+            red_win_chance=red_odds,
+            blue_win_chance=blue_odds,
+            red_score=red_scores,
+            blue_score=blue_scores,
+            **{f"red_{bonus}_rp_chance": red_bonuses[:, idx] for idx, bonus in enumerate(BONUS_RPS)},
+            **{f"blue_{bonus}_rp_chance": blue_bonuses[:, idx] for idx, bonus in enumerate(BONUS_RPS)},
+        )
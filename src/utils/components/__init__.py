@@ -1,4 +1,5 @@
 from .alliance_breakdown import *
 from .colored_metric import *
 from .colored_metric_with_two_values import *
+from .offline_indicator import *
 from .win_percentages import *
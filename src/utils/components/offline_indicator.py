@@ -0,0 +1,13 @@
+"""Creates a component to display which data sources are offline."""
+
+import streamlit as st
+
+from ..fetching import offline_sources
+
+__all__ = ["offline_indicator"]
+
+
+def offline_indicator() -> None:
+    """Creates a small indicator in the sidebar for every data source that's offline and being served locally."""
+    for source, offline_since in offline_sources().items():
+        st.sidebar.caption(f"📡 {source} offline since {offline_since:%H:%M} (showing the latest local data)")
@@ -19,6 +19,20 @@ class GeneralConstants:
         "Average Throughput Speed",
     ]
     SECONDS_TO_CACHE = 60 * 1.5
+
+    # HTTP timeouts per source, as (seconds to connect, seconds to wait for a response)
+    GITHUB_TIMEOUT = (3.05, 10)
+    TBA_TIMEOUT = (3.05, 10)
+    STATBOTICS_TIMEOUT = (3.05, 15)
+    PROBE_TIMEOUT = (3.05, 5)
+    HTTP_RETRIES = 2
+    HTTP_BACKOFF_FACTOR = 0.5
+
+    # Notion API (the base URL can be overridden with the NOTION_BASE_URL environment variable, e.g. for a stub server)
+    NOTION_BASE_URL = "https://api.notion.com"
+    NOTION_MAX_WORKERS = 3
+    NOTION_REQUESTS_PER_SECOND = 3
+    NOTION_MAX_RETRIES = 5
     PRIMARY_COLOR = "#EFAE09"
     AVERAGE_FOUL_RATE = 1.06
 
@@ -56,6 +70,7 @@ class EventSpecificConstants:
     PIT_SCOUTING_URL = (
         f"https://raw.githubusercontent.com/team4099/ScoutingAppData/main/{EVENT_CODE}_pit_scouting_data.json"
     )
+    TBA_EVENT_MATCHES_URL = f"https://www.thebluealliance.com/api/v3/event/{EVENT_CODE}/matches"
     PICKLIST_URL = "https://www.notion.so/team4099/d19066533a8844d3aa2cd9e68e70f214?v=56e109b2298d46ebb00057f05d38bba8"
     # if no connection
     LOCAL_JSON_PATH = f"./src/data/{EVENT_CODE}_match_data.json"
@@ -110,6 +125,28 @@ class Queries:
     INTAKE_DEFENSE_RATING = "IntakeDefenseRating"
     RATING_NOTES = "RatingNotes"
 
+    # Numeric encodings of the fields above, added to the scouting data at ingest
+    DRIVER_RATING_VALUE = "DriverRatingValue"
+    INTAKE_SPEED_VALUE = "IntakeSpeedValue"
+    THROUGHPUT_SPEED_VALUE = "ThroughputSpeedValue"
+    DEFENSE_RATING_VALUE = "DefenseRatingValue"
+    SHOOTER_DEFENSE_RATING_VALUE = "ShooterDefenseRatingValue"
+    INTAKE_DEFENSE_RATING_VALUE = "IntakeDefenseRatingValue"
+    STABILITY_VALUE = "StabilityRatingValue"
+    CLIMB_SPEED_VALUE = "ClimbSpeedValue"
+    TELEOP_CLIMB_LEVEL = "TeleopClimbLevel"
+    AUTO_CLIMB_FLAG = "AutoClimbFlag"
+    TELEOP_CLIMB_FLAG = "TeleopClimbFlag"
+    DISABLE_FLAG = "DisabledFlag"
+    SHOOT_ON_THE_MOVE_FLAG = "ShootOnTheMoveFlag"
+    NOTES = "Notes"
+    NOTES_POSITIVITY = "NotesPositivity"
+    AUTO_SCORING_SIDE_MASK = "AutoScoringSideMask"
+    TELEOP_SCORING_SIDE_MASK = "TeleopScoringSideMask"
+    AUTO_TRENCH_BUMP_MASK = "AutoTrenchBumpMask"
+    TELEOP_TRENCH_BUMP_MASK = "TeleopTrenchBumpMask"
+    ROBOT_STYLE_TYPE_MASK = "RobotStyleTypeMask"
+
     # Alliance constants
     RED_ALLIANCE = "red"
     BLUE_ALLIANCE = "blue"
@@ -192,3 +229,15 @@ class Criteria:
         "Poor": 2,
         "Very Poor": 1
     }
+
+    # Options of multi-select fields (submitted as lists or concatenated strings), in the order of their bitmask bits
+    SCORING_SIDE_OPTIONS = [
+        "Depot Side near TRENCH",
+        "Depot Side near Driver Station",
+        "Centered flush with HUB",
+        "Centered near Driver Station",
+        "Human Player Side near TRENCH",
+        "Human Player Side near Driver Station",
+    ]
+    TRENCH_BUMP_OPTIONS = ["Over the BUMP", "Through the TRENCH"]
+    ROBOT_STYLE_OPTIONS = ["Shooter dumper", "Shooter sprinter", "Passer", "Shover", "Defense"]
@@ -0,0 +1,423 @@
+"""Defines the conditional HTTP fetching and background refreshing used to keep data sources up to date."""
+
+from datetime import datetime
+from hashlib import sha256
+from pickle import dumps
+from threading import Event, Lock, Thread
+from time import sleep
+from typing import Any, Callable, Hashable
+from urllib.parse import urlsplit
+
+from requests import RequestException, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .constants import GeneralConstants
+
+__all__ = [
+    "CircuitBreaker",
+    "fetch_conditionally",
+    "http_get",
+    "offline_sources",
+    "single_flight",
+    "SnapshotRefresher",
+    "SnapshotUnavailableError",
+    "SourceOfflineError"
+]
+
+
+def _create_session() -> Session:
+    """Creates the connection-pooled session shared by every request made by FalconVis.
+
+    Connections are kept alive between requests, responses are gzip-compressed and idempotent requests that fail
+    to connect or get a transient error (429/5xx) are retried a bounded number of times with exponential backoff.
+
+    :return: The session to send requests with.
+    """
+    session = Session()
+    session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+
+    retries = Retry(
+        total=GeneralConstants.HTTP_RETRIES,
+        backoff_factor=GeneralConstants.HTTP_BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+_SESSION = _create_session()
+
+
+class _Flight:
+    """A call in progress that other callers with the same key wait on."""
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+# Maps the key of each call in progress to its flight.
+_FLIGHTS: dict[Hashable, _Flight] = {}
+_FLIGHTS_LOCK = Lock()
+
+
+def single_flight(key: Hashable, function: Callable[[], Any]) -> Any:
+    """Calls a function, unless a call with the same key is already in progress, in which case that call's result
+    is waited on and returned instead (or its exception raised).
+
+    :param key: The key identifying the call (e.g. the URL being fetched).
+    :param function: The function to call.
+    :return: The result of the call.
+    """
+    with _FLIGHTS_LOCK:
+        flight = _FLIGHTS.get(key)
+        is_leader = flight is None
+        if is_leader:
+            flight = _FLIGHTS[key] = _Flight()
+
+    if not is_leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = function()
+        return flight.result
+    except BaseException as error:
+        flight.error = error
+        raise
+    finally:
+        with _FLIGHTS_LOCK:
+            del _FLIGHTS[key]
+        flight.done.set()
+
+
+class SourceOfflineError(RequestException):
+    """Raised instead of sending a request to a source whose circuit breaker is open."""
+
+
+class SnapshotUnavailableError(RuntimeError):
+    """Raised when a data source couldn't be loaded from its source nor from a local snapshot."""
+
+
+class CircuitBreaker:
+    """Tracks whether a source can be reached, failing requests to it immediately while it's down.
+
+    The breaker opens after `FAILURE_THRESHOLD` consecutive failed requests. While it's open, a background
+    thread probes the source every `PROBE_INTERVAL` seconds and closes the breaker once the source responds.
+    """
+    FAILURE_THRESHOLD = 2
+    PROBE_INTERVAL = 30
+
+    def __init__(self, source: str, probe_url: str):
+        """Creates a closed circuit breaker for a source.
+
+        :param source: The name of the source (its host).
+        :param probe_url: The URL requested to check whether the source can be reached again.
+        """
+        self.source = source
+        self.probe_url = probe_url
+        self.offline_since: datetime | None = None
+        self._failures = 0
+        self._lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the source is considered offline."""
+        return self.offline_since is not None
+
+    def record_success(self) -> None:
+        """Records that the source responded, closing the breaker."""
+        with self._lock:
+            self._failures = 0
+            self.offline_since = None
+
+    def record_failure(self) -> None:
+        """Records that the source couldn't be reached, opening the breaker once enough failures happen in a row."""
+        with self._lock:
+            self._failures += 1
+
+            if self._failures >= self.FAILURE_THRESHOLD and not self.is_open:
+                self.offline_since = datetime.now()
+                Thread(target=self._probe_until_closed, name=f"probe-{self.source}", daemon=True).start()
+
+    def _probe_until_closed(self) -> None:
+        """Probes the source in the background until it can be reached again."""
+        while self.is_open:
+            sleep(self.PROBE_INTERVAL)
+
+            try:
+                if _SESSION.head(self.probe_url, timeout=GeneralConstants.PROBE_TIMEOUT).status_code < 500:
+                    self.record_success()
+            except RequestException:
+                pass
+
+
+# Maps the host of each source to its circuit breaker.
+_CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+_CIRCUIT_BREAKERS_LOCK = Lock()
+
+
+def _circuit_breaker(url: str) -> CircuitBreaker:
+    """Retrieves the circuit breaker of the source (host) that a URL belongs to.
+
+    :param url: The URL being requested.
+    :return: The circuit breaker for the URL's host.
+    """
+    parsed_url = urlsplit(url)
+
+    with _CIRCUIT_BREAKERS_LOCK:
+        if (breaker := _CIRCUIT_BREAKERS.get(parsed_url.netloc)) is None:
+            breaker = _CIRCUIT_BREAKERS[parsed_url.netloc] = CircuitBreaker(
+                parsed_url.netloc, f"{parsed_url.scheme}://{parsed_url.netloc}/"
+            )
+
+    return breaker
+
+
+def offline_sources() -> dict[str, datetime]:
+    """Retrieves the sources that are currently considered offline.
+
+    :return: A dictionary mapping the host of each offline source to when it went offline.
+    """
+    with _CIRCUIT_BREAKERS_LOCK:
+        return {
+            source: breaker.offline_since
+            for source, breaker in _CIRCUIT_BREAKERS.items()
+            if breaker.offline_since is not None
+        }
+
+
+def http_get(
+    url: str,
+    timeout: tuple[float, float],
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None
+) -> Response:
+    """Sends a GET request through the shared connection-pooled session.
+
+    Requests to a source that's offline fail immediately (see `CircuitBreaker`) so callers can fall back to
+    their local data without waiting on a timeout, and identical requests made at the same time share a
+    single response (see `single_flight`).
+
+    :param url: The URL to send the request to.
+    :param timeout: The seconds to wait to connect to the server and for it to respond.
+    :param params: Any query parameters to send with the request.
+    :param headers: Any additional headers to send with the request.
+    :return: The response from the server.
+    :raises SourceOfflineError: If the source is currently offline.
+    :raises requests.RequestException: If the server couldn't be reached after retrying.
+    """
+    breaker = _circuit_breaker(url)
+
+    if breaker.is_open:
+        raise SourceOfflineError(f"{breaker.source} has been offline since {breaker.offline_since:%H:%M:%S}.")
+
+    def _send() -> Response:
+        # Only the caller sending the request records its outcome, so callers sharing it count as one request.
+        try:
+            response = _SESSION.get(url, params=params, headers=headers, timeout=timeout)
+        except RequestException:
+            breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        return response
+
+    key = (url, tuple(sorted((params or {}).items())), tuple(sorted((headers or {}).items())))
+    return single_flight(key, _send)
+
+
+class _ConditionalResource:
+    """The validators and parsed value of the last successful fetch of a resource."""
+
+    def __init__(self, etag: str | None, last_modified: str | None, content_hash: str, value: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.value = value
+
+
+# Maps a (url, parser name) pair to the last version of the resource fetched and parsed with that parser.
+_RESOURCES: dict[tuple[str, str], _ConditionalResource] = {}
+_RESOURCES_LOCK = Lock()
+
+
+def fetch_conditionally(
+    url: str,
+    parse: Callable[[bytes], Any],
+    timeout: tuple[float, float],
+    headers: dict[str, str] | None = None
+) -> Any:
+    """Fetches a resource and parses it, reusing the previously parsed value whenever the resource hasn't changed.
+
+    The ETag/Last-Modified of the last response are sent back as `If-None-Match`/`If-Modified-Since`, so an
+    unchanged resource costs a 304 and no parsing. Servers that ignore those headers are handled by comparing a
+    hash of the body against the body that was last parsed.
+
+    :param url: The URL of the resource to fetch.
+    :param parse: The function used to convert the raw body of the resource into the value returned.
+    :param timeout: The seconds to wait to connect to the server and for it to respond.
+    :param headers: Any additional headers to send with the request (e.g. authentication).
+    :return: The parsed resource.
+    :raises requests.RequestException: If the resource couldn't be fetched.
+    """
+    key = (url, getattr(parse, "__qualname__", repr(parse)))
+
+    with _RESOURCES_LOCK:
+        cached = _RESOURCES.get(key)
+
+    headers = dict(headers or {})
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    response = http_get(url, timeout, headers=headers)
+
+    if response.status_code == 304 and cached is not None:
+        return cached.value
+
+    response.raise_for_status()
+    content_hash = sha256(response.content).hexdigest()
+
+    if cached is not None and cached.content_hash == content_hash:
+        value = cached.value
+    else:
+        value = parse(response.content)
+
+    with _RESOURCES_LOCK:
+        _RESOURCES[key] = _ConditionalResource(
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            content_hash,
+            value
+        )
+
+    return value
+
+
+def _content_version(value: Any) -> str:
+    """Creates a token identifying the contents of a value, which only changes when its contents change.
+
+    :param value: The value (e.g. a snapshot of a data source) to identify.
+    :return: A hash of the value's contents.
+    """
+    return sha256(dumps(value, protocol=5)).hexdigest()
+
+
+class SnapshotRefresher:
+    """Keeps the latest snapshot of a data source warm by reloading it on a background thread.
+
+    Readers always receive the current snapshot immediately; the only time a reader waits is for the very first
+    load. New snapshots replace the old one with a single reference swap, so a reader never sees a half-built
+    snapshot, and snapshots must be treated as read-only since they're shared between readers.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[], Any],
+        interval: float,
+        name: str,
+        fallback: Callable[[], Any],
+        version: Callable[[Any], str] = _content_version
+    ):
+        """Creates a refresher for a data source, which starts loading the first time it's read from.
+
+        :param load: The function used to load a new snapshot of the data source (raising if it can't be loaded).
+        :param interval: The number of seconds to wait between reloading the data source.
+        :param name: The name of the data source (used to name the background thread).
+        :param fallback: The function used to load a local snapshot when the data source can't be loaded and
+                         there's no previous snapshot to keep serving.
+        :param version: The function used to identify the contents of a new snapshot (hashing the whole snapshot
+                        by default).
+        """
+        self._load = load
+        self._fallback = fallback
+        self._version = version
+        self._interval = interval
+        self._name = name
+        self._current: tuple[Any, str] | None = None
+        self._loaded = Event()
+        self._thread: Thread | None = None
+        self._thread_lock = Lock()
+
+    def get(self) -> Any:
+        """Retrieves the latest snapshot of the data source.
+
+        :return: The latest snapshot loaded.
+        :raises SnapshotUnavailableError: If neither the data source nor its fallback could be loaded yet.
+        """
+        return self._latest()[0]
+
+    def get_with_version(self) -> tuple[str, Any]:
+        """Retrieves the latest snapshot of the data source alongside its version.
+
+        Both are read together, so the version always identifies the snapshot returned even while a refresh lands.
+        The version is a hash of the snapshot's contents, which changes exactly when the data source changes.
+
+        :return: A tuple of the version of the latest snapshot and the snapshot.
+        :raises SnapshotUnavailableError: If neither the data source nor its fallback could be loaded yet.
+        """
+        snapshot, version = self._latest()
+        return version, snapshot
+
+    def _latest(self) -> tuple[Any, str]:
+        """Retrieves the latest snapshot alongside its version, starting the refresher if it hasn't started yet.
+
+        :return: A tuple of the latest snapshot and its version.
+        :raises SnapshotUnavailableError: If neither the data source nor its fallback could be loaded yet.
+        """
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = Thread(target=self._refresh_forever, name=f"refresh-{self._name}", daemon=True)
+                    self._thread.start()
+
+        self._loaded.wait()
+
+        if (current := self._current) is None:
+            raise SnapshotUnavailableError(
+                f"{self._name} couldn't be loaded from its source or a local snapshot, retrying every "
+                f"{self._interval:g} seconds."
+            )
+
+        return current
+
+    def _swap(self, snapshot: Any) -> None:
+        """Replaces the current snapshot, re-hashing it only when a different snapshot was loaded.
+
+        :param snapshot: The snapshot that was just loaded.
+        """
+        if self._current is None or snapshot is not self._current[0]:
+            self._current = (snapshot, self._version(snapshot))
+
+    def _refresh_forever(self) -> None:
+        """Reloads the data source every interval, keeping the previous (or local) snapshot if a reload fails."""
+        while True:
+            try:
+                self._swap(self._load())
+            except Exception:
+                if self._current is None:
+                    try:
+                        self._swap(self._fallback())
+                    except Exception:
+                        pass  # Nothing to serve yet, so both are tried again on the next interval
+            finally:
+                self._loaded.set()
+
+            sleep(self._interval)
@@ -1,35 +1,103 @@
 """Defines utility functions that are later used in FalconVis."""
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
 from io import StringIO
-from json import load, loads
-from re import search, sub
+from json import dumps, load, loads
 from typing import Any
+from weakref import ReferenceType, ref
 from dotenv import load_dotenv
-import requests
 
 import streamlit as st
-from numpy import int64
-from pandas import DataFrame, read_csv, to_numeric
-from requests import get
-from tbapy import TBA
+from numpy import arange, float32, int8, int64, ndarray, uint8, zeros
+from pandas import concat, DataFrame, read_csv, Series, set_option, to_numeric
 
-from .constants import EventSpecificConstants, GeneralConstants, Queries
+from .components import offline_indicator
+from .constants import Criteria, EventSpecificConstants, GeneralConstants, Queries
+from .fetching import _content_version, fetch_conditionally, SnapshotRefresher
+from .note_analysis import combined_notes, notes_positivity
+from .snapshot_store import append_snapshot, load_snapshot, save_snapshot
+from .statbotics import retrieve_statbotics_data
 
 __all__ = [
+    "encode_scouting_data",
+    "matches_for_team",
     "note_scouting_data_for_team",
+    "option_counts",
     "populate_missing_data",
+    "prefetch_data_sources",
     "retrieve_match_schedule",
     "retrieve_match_data",
+    "retrieve_match_data_with_version",
+    "retrieve_match_schedule_with_version",
     "retrieve_note_scouting_data",
     "retrieve_pit_scouting_data",
     "retrieve_team_list",
     "retrieve_scouting_data",
+    "retrieve_scouting_data_with_version",
+    "retrieve_team_matches",
     "scouting_data_for_team",
-    "retrieve_match_data_raw"
+    "setup_page",
+    "retrieve_match_data_raw",
+    "team_row_positions"
 ]
 
 load_dotenv()
 
+# The TBA read key is read from the environment, falling back to a key used for testing purposes.
+_TBA_AUTH_KEY = os.getenv("HEADERS") or "6lcmneN5bBDYpC47FolBxp2RZa4AbQCVpmKMSKw9x9btKt7da5yMzVamJYk0XDBm"
+
+# Maps rating fields to the numeric column they're encoded into and the criteria used to encode them.
+_RATING_ENCODINGS = {
+    Queries.DRIVER_RATING: (Queries.DRIVER_RATING_VALUE, Criteria.DRIVER_RATING_CRITERIA),
+    Queries.INTAKE_SPEED: (Queries.INTAKE_SPEED_VALUE, Criteria.INTAKE_SPEED_CRITERIA),
+    Queries.THROUGHPUT_SPEED: (Queries.THROUGHPUT_SPEED_VALUE, Criteria.BASIC_RATING_CRITERIA),
+    Queries.DEFENSE_RATING: (Queries.DEFENSE_RATING_VALUE, Criteria.BASIC_RATING_CRITERIA),
+    Queries.SHOOTER_DEFENSE_RATING: (Queries.SHOOTER_DEFENSE_RATING_VALUE, Criteria.BASIC_RATING_CRITERIA),
+    Queries.INTAKE_DEFENSE_RATING: (Queries.INTAKE_DEFENSE_RATING_VALUE, Criteria.BASIC_RATING_CRITERIA),
+    Queries.STABILITY: (Queries.STABILITY_VALUE, Criteria.STABILITY_CRITERIA),
+    Queries.CLIMB_SPEED: (Queries.CLIMB_SPEED_VALUE, Criteria.CLIMB_SPEED_CRITERIA),
+}
+
+# Maps boolean fields to the flag column they're encoded into.
+_FLAG_ENCODINGS = {
+    Queries.AUTO_CLIMB: Queries.AUTO_CLIMB_FLAG,
+    Queries.DISABLE: Queries.DISABLE_FLAG,
+    Queries.SHOOT_ON_THE_MOVE: Queries.SHOOT_ON_THE_MOVE_FLAG,
+}
+
+# Maps multi-select fields to the bitmask column they're encoded into and their options (one bit per option).
+_MULTI_SELECT_ENCODINGS = {
+    Queries.AUTO_SCORING_SIDE: (Queries.AUTO_SCORING_SIDE_MASK, Criteria.SCORING_SIDE_OPTIONS),
+    Queries.TELEOP_SCORING_SIDE: (Queries.TELEOP_SCORING_SIDE_MASK, Criteria.SCORING_SIDE_OPTIONS),
+    Queries.AUTO_TRENCH_BUMP: (Queries.AUTO_TRENCH_BUMP_MASK, Criteria.TRENCH_BUMP_OPTIONS),
+    Queries.TELEOP_TRENCH_BUMP: (Queries.TELEOP_TRENCH_BUMP_MASK, Criteria.TRENCH_BUMP_OPTIONS),
+    Queries.ROBOT_STYLE_TYPE: (Queries.ROBOT_STYLE_TYPE_MASK, Criteria.ROBOT_STYLE_OPTIONS),
+}
+
+# The columns added by `encode_scouting_data`, used to discard snapshots saved before an encoding was added.
+_ENCODED_COLUMNS = {
+    *(encoded_field for encoded_field, _ in _RATING_ENCODINGS.values()),
+    *_FLAG_ENCODINGS.values(),
+    *(encoded_field for encoded_field, _ in _MULTI_SELECT_ENCODINGS.values()),
+    Queries.TELEOP_CLIMB_LEVEL,
+    Queries.TELEOP_CLIMB_FLAG,
+    Queries.NOTES,
+    Queries.NOTES_POSITIVITY,
+}
+
+# Maps every control character (C0 and C1) to None so `str.translate` removes them.
+_CONTROL_CHARACTERS = dict.fromkeys([*range(0x00, 0x20), *range(0x7F, 0xA0)])
+
+
+# Parses TBA match keys (without the event code) such as "qm12", "sf3m1" and "f1m2".
+_MATCH_KEY_PATTERN = r"^(?P<comp_level>[a-z]+)(?:(?P<set_number>\d+)m)?(?P<match_number>\d+)$"
+
+# Maps the id of a scouting data frame to a weak reference to it and its team -> row positions index.
+_TEAM_ROW_POSITIONS: dict[int, tuple[ReferenceType, dict[int, ndarray]]] = {}
+
+
 def populate_missing_data(distributions: list[list], sentinel: Any = None) -> tuple[range, list]:
     """Populates missing data points when plotting multiple distributions.
 
@@ -49,77 +117,283 @@ def populate_missing_data(distributions: list[list], sentinel: Any = None) -> tu
     )
 
 
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
-def retrieve_scouting_data() -> DataFrame:
-    """Retrieves the latest scouting data from team4099/ScoutingAppData on GitHub based on the current event.
+class _ScoutingIngest:
+    """The submissions from the last scouting data parsed alongside the dataframe built from them."""
+
+    def __init__(self, record_hashes: Counter, data: DataFrame, version: str):
+        self.record_hashes = record_hashes
+        self.data = data
+        self.version = version
+
+
+_LAST_SCOUTING_INGEST: _ScoutingIngest | None = None
+
+
+def _record_hash(record: dict) -> str:
+    """Hashes the contents of a raw scouting submission, so that edited submissions can be told apart.
+
+    :param record: The raw scouting submission.
+    :return: A hash of every field of the submission.
+    """
+    return sha256(dumps(record, sort_keys=True).encode()).hexdigest()
+
+
+def _match_numbers(match_keys: Series) -> Series:
+    """Extracts the match number (the first number) out of every match key (e.g. 12 from "qm12").
 
+    :param match_keys: The match keys to extract match numbers from.
+    :return: The match number of each match key.
+    """
+    return match_keys.str.extract(r"(\d+)", expand=False).astype(int64)
+
+
+def _clean_scouting_data(records: list[dict]) -> DataFrame:
+    """Cleans and encodes raw scouting submissions into a dataframe.
+
+    :param records: The raw scouting submissions.
+    :return: A dataframe containing the cleaned and encoded submissions (in the order given).
+    """
+    scouting_data = DataFrame.from_dict(check_utf8(records))
+
+    scouting_data[Queries.MATCH_NUMBER] = _match_numbers(scouting_data[Queries.MATCH_KEY])
+    scouting_data[Queries.TEAM_NUMBER] = scouting_data[Queries.TEAM_NUMBER].astype(int64)
+
+    return encode_scouting_data(scouting_data)
+
+
+def _parse_scouting_data(raw: bytes | str) -> DataFrame:
+    """Parses the raw JSON of the scouting data into a cleaned, encoded dataframe sorted by match number.
+
+    Submissions are compared to the last data parsed by a hash of their contents. When submissions were only
+    added, just the new ones are cleaned and encoded, then appended to the last dataframe parsed (which is only
+    re-sorted if they belong before its last match) and to its snapshot. If any submission was edited or removed,
+    the dataframe is rebuilt from scratch.
+
+    :param raw: The raw JSON of the scouting data.
     :return: A dataframe containing the scouting data from an event.
     """
+    global _LAST_SCOUTING_INGEST
+
+    records = loads(raw)
+    hashes = [_record_hash(record) for record in records]
+    record_hashes = Counter(hashes)
+    last_ingest = _LAST_SCOUTING_INGEST
+
+    if last_ingest is None or last_ingest.record_hashes - record_hashes:
+        scouting_data = _clean_scouting_data(records)
+        scouting_data = scouting_data.sort_values(by=Queries.MATCH_NUMBER, kind="stable").reset_index(drop=True)
+        save_snapshot("scouting_data", scouting_data)
+    else:
+        seen = Counter()
+        new_records = []
+
+        for record, record_hash in zip(records, hashes):
+            seen[record_hash] += 1
+            if seen[record_hash] > last_ingest.record_hashes[record_hash]:
+                new_records.append(record)
+
+        if not new_records:
+            return last_ingest.data
+
+        new_rows = _clean_scouting_data(new_records).sort_values(by=Queries.MATCH_NUMBER, kind="stable")
+        scouting_data = concat([last_ingest.data, new_rows], ignore_index=True)
+
+        if new_rows[Queries.MATCH_NUMBER].iat[0] >= last_ingest.data[Queries.MATCH_NUMBER].iat[-1]:
+            append_snapshot("scouting_data", new_rows, scouting_data)
+        else:
+            scouting_data = scouting_data.sort_values(by=Queries.MATCH_NUMBER, kind="stable").reset_index(drop=True)
+            save_snapshot("scouting_data", scouting_data)
+
+    _LAST_SCOUTING_INGEST = _ScoutingIngest(record_hashes, scouting_data, sha256("".join(hashes).encode()).hexdigest())
+    return scouting_data
+
+
+def _scouting_data_version(scouting_data: DataFrame) -> str:
+    """Identifies the contents of the scouting data, reusing the hashes of its submissions when it was just parsed
+    instead of hashing the whole dataframe.
+
+    :param scouting_data: The scouting data to identify.
+    :return: A hash of the contents of the scouting data.
+    """
+    if (last_ingest := _LAST_SCOUTING_INGEST) is not None and last_ingest.data is scouting_data:
+        return last_ingest.version
+
+    return _content_version(scouting_data)
+
+
+def _parse_note_scouting_data(raw: bytes | str) -> DataFrame:
+    """Parses the raw JSON of the note scouting data into a dataframe sorted by match number.
+
+    :param raw: The raw JSON of the note scouting data.
+    :return: A dataframe containing the note scouting data from an event.
+    """
+    scouting_data = DataFrame.from_dict(loads(raw))
+    scouting_data[Queries.MATCH_NUMBER] = _match_numbers(scouting_data[Queries.MATCH_KEY])
+    scouting_data = scouting_data.sort_values(by=Queries.MATCH_NUMBER).reset_index(drop=True)
+    save_snapshot("note_scouting_data", scouting_data)
+    return scouting_data
+
+
+def _parse_pit_scouting_data(raw: bytes | str) -> DataFrame:
+    """Parses the raw JSON of the pit scouting data into a dataframe.
+
+    :param raw: The raw JSON of the pit scouting data.
+    :return: A dataframe containing the pit scouting data from an event.
+    """
+    pit_scouting_data = DataFrame.from_dict(check_utf8(loads(raw)))
+    save_snapshot("pit_scouting_data", pit_scouting_data)
+    return pit_scouting_data
+
+
+def _load_scouting_data() -> DataFrame:
+    """Loads the latest scouting data from GitHub.
+
+    The data is only re-parsed when GitHub reports that it changed (see `fetch_conditionally`).
+
+    :return: A dataframe containing the scouting data from an event.
+    """
+    return fetch_conditionally(EventSpecificConstants.URL, _parse_scouting_data, GeneralConstants.GITHUB_TIMEOUT)
+
 
-    scouting_data: DataFrame
+def _load_local_scouting_data() -> DataFrame:
+    """Loads the local copy of the scouting data, used when GitHub can't be reached.
+
+    The snapshot of the last scouting data fetched is preferred over the JSON copy of the data, unless it was saved
+    before one of the current encodings was added.
+
+    :return: A dataframe containing the scouting data from an event (empty if there's no local copy).
+    """
+    snapshot = load_snapshot("scouting_data")
+    if snapshot is not None and _ENCODED_COLUMNS <= set(snapshot.columns):
+        return snapshot
 
     try:
-        raw = get(EventSpecificConstants.URL).text
-        data = loads(raw)
-        scouting_data = DataFrame.from_dict(check_utf8(data))
+        with open(EventSpecificConstants.LOCAL_JSON_PATH, encoding='utf-8') as f:
+            return _parse_scouting_data(f.read())
     except Exception:
-        try:
-            with open(EventSpecificConstants.LOCAL_JSON_PATH, encoding='utf-8') as f:
-                data = load(f)
-            scouting_data = DataFrame.from_dict(check_utf8(data))
-        except Exception:
-            return DataFrame()
+        return DataFrame()
+
 
-    scouting_data[Queries.MATCH_NUMBER] = scouting_data[Queries.MATCH_KEY].apply(
-        lambda match_key: int(search(r"\d+", match_key).group(0))
+def _load_note_scouting_data() -> DataFrame:
+    """Loads the latest note scouting data from GitHub.
+
+    :return: A dataframe containing the note scouting data from an event.
+    """
+    return fetch_conditionally(
+        EventSpecificConstants.URL, _parse_note_scouting_data, GeneralConstants.GITHUB_TIMEOUT
     )
 
-    scouting_data[Queries.TEAM_NUMBER] = scouting_data[Queries.TEAM_NUMBER].apply(int)
 
-    return scouting_data.sort_values(by=Queries.MATCH_NUMBER).reset_index(drop=True)
+def _load_local_note_scouting_data() -> DataFrame:
+    """Loads the snapshot of the last note scouting data fetched, used when GitHub can't be reached.
+
+    :return: A dataframe containing the note scouting data from an event (empty if there's no snapshot).
+    """
+    snapshot = load_snapshot("note_scouting_data")
+    return DataFrame() if snapshot is None else snapshot
+
+
+def _load_pit_scouting_data() -> DataFrame:
+    """Loads the latest pit scouting data from GitHub.
+
+    :return: A dataframe containing the pit scouting data from an event.
+    """
+    return fetch_conditionally(
+        EventSpecificConstants.PIT_SCOUTING_URL, _parse_pit_scouting_data, GeneralConstants.GITHUB_TIMEOUT
+    )
+
+
+def _load_local_pit_scouting_data() -> DataFrame:
+    """Loads the snapshot of the last pit scouting data fetched, used when GitHub can't be reached.
+
+    :return: A dataframe containing the pit scouting data from an event (empty if there's no snapshot).
+    """
+    snapshot = load_snapshot("pit_scouting_data")
+    return DataFrame() if snapshot is None else snapshot
+
+
+_SCOUTING_DATA = SnapshotRefresher(
+    _load_scouting_data,
+    GeneralConstants.SECONDS_TO_CACHE,
+    "scouting-data",
+    fallback=_load_local_scouting_data,
+    version=_scouting_data_version
+)
+
+
+def retrieve_scouting_data() -> DataFrame:
+    """Retrieves the latest scouting data from team4099/ScoutingAppData on GitHub based on the current event.
+
+    The data is refreshed on a background thread, so the latest snapshot is returned immediately. The dataframe
+    is shared between every reader and must be treated as read-only.
+
+    :return: A dataframe containing the scouting data from an event.
+    """
+    return _SCOUTING_DATA.get()
+
+
+def retrieve_scouting_data_with_version() -> tuple[str, DataFrame]:
+    """Retrieves the latest scouting data alongside its version.
+
+    The version is a hash of the contents of the scouting data returned alongside it, so caches of anything
+    derived from the scouting data should be keyed on it.
+
+    :return: A tuple of the version of the scouting data and the scouting data itself.
+    """
+    return _SCOUTING_DATA.get_with_version()
 
 
 @st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
 def retrieve_note_scouting_data() -> DataFrame:
     """Retrieves the latest note scouting data from team4099/ScoutingAppData on GitHub based on the current event.
 
+    The data is only fetched when it's asked for, falling back to the last note scouting data fetched.
+
     :return: A dataframe containing the scouting data from an event.
     """
     try:
-        scouting_data = DataFrame.from_dict(
-            loads(get(EventSpecificConstants.URL).text)
-        )
-        scouting_data[Queries.MATCH_NUMBER] = scouting_data[Queries.MATCH_KEY].apply(
-            lambda match_key: int(search(r"\d+", match_key).group(0))
-        )
-        return scouting_data.sort_values(by=Queries.MATCH_NUMBER).reset_index(drop=True)
+        return _load_note_scouting_data()
     except Exception:
-        return DataFrame()
+        return _load_local_note_scouting_data()
 
 
 @st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
 def retrieve_pit_scouting_data() -> DataFrame:
-    """Retrieves the latest pit scouting data from team4099/ScoutingAppData on GitHub based on the current event."""
+    """Retrieves the latest pit scouting data from team4099/ScoutingAppData on GitHub based on the current event.
+
+    The data is only fetched when it's asked for, falling back to the last pit scouting data fetched.
+    """
     try:
-        return DataFrame.from_dict(
-            check_utf8(loads(get(EventSpecificConstants.PIT_SCOUTING_URL).text))
-        )
+        return _load_pit_scouting_data()
     except Exception:
-        return DataFrame()
+        return _load_local_pit_scouting_data()
 
 
-# Cache for longer because match schedule is relatively constant.
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE * 4)
-def retrieve_match_schedule() -> DataFrame:
-    """Retrieves the match schedule for the current event using TBA."""
-    tba_instance = TBA(
-        auth_key="6lcmneN5bBDYpC47FolBxp2RZa4AbQCVpmKMSKw9x9btKt7da5yMzVamJYk0XDBm"  # For testing purposes
-    )
+class _EventMatches:
+    """A snapshot of the matches at an event from TBA alongside the views derived from it."""
+
+    def __init__(self, raw: list[dict], schedule: DataFrame | None = None, results: DataFrame | None = None):
+        self.raw = raw
+        self.schedule = _match_schedule_from_event_matches(raw) if schedule is None else schedule
+        self.results = _match_results_from_event_matches(raw) if results is None else results
+        self.team_matches = _team_matches_from_schedule(self.schedule)
+        self.matches_by_team = {
+            team: self.team_matches["schedule_position"].to_numpy()[rows]
+            for team, rows in self.team_matches.groupby("team", sort=False).indices.items()
+        }
+
+
+def _match_schedule_from_event_matches(event_matches: list[dict]) -> DataFrame:
+    """Creates the match schedule from the matches at an event, falling back to the local match schedule.
+
+    :param event_matches: The matches at an event from TBA.
+    :return: A dataframe with the key and the red and blue alliances of every match, in the order played.
+    """
     match_levels_to_order = {"qm": 0, "sf": 1, "f": 2}
 
     try:
         event_matches = sorted(
-            tba_instance.event_matches(EventSpecificConstants.EVENT_CODE),
+            event_matches,
             key=lambda match_info: (match_levels_to_order[match_info["comp_level"]], match_info["match_number"])
         )
     except Exception:
@@ -143,34 +417,43 @@ def retrieve_match_schedule() -> DataFrame:
         except Exception:
             return DataFrame(columns=["match_key", "red_alliance", "blue_alliance"])
 
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
-def retrieve_match_data_raw():
-    try:
-        return requests.get(
-            f"https://www.thebluealliance.com/api/v3/event/{EventSpecificConstants.EVENT_CODE}/matches",
-            headers={"X-TBA-Auth-Key": os.getenv("HEADERS")}
-        ).json()
-    except Exception:
-        return []
 
+def _team_matches_from_schedule(schedule: DataFrame) -> DataFrame:
+    """Normalizes the match schedule into a long table with one row per team per match.
 
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE // 2)
-def retrieve_match_data() -> DataFrame:
-    """Retrieves the TBA match data at an event up to the latest matches they've played."""
-    tba_instance = TBA(
-        auth_key="6lcmneN5bBDYpC47FolBxp2RZa4AbQCVpmKMSKw9x9btKt7da5yMzVamJYk0XDBm"  # For testing purposes
-    )
+    :param schedule: The match schedule (see `_match_schedule_from_event_matches`).
+    :return: A dataframe with the position of the match within the schedule, its key, comp level, set and match
+             number, and the alliance and number of the team, in the order the matches are played.
+    """
+    match_keys = schedule["match_key"].astype(str)
+    parsed_keys = match_keys.str.extract(_MATCH_KEY_PATTERN)
+    matches = DataFrame({
+        "schedule_position": arange(len(schedule)),
+        "match_key": match_keys.to_numpy(),
+        "comp_level": parsed_keys["comp_level"].to_numpy(),
+        "set_number": to_numeric(parsed_keys["set_number"]).fillna(1).astype(int64).to_numpy(),
+        "match_number": to_numeric(parsed_keys["match_number"]).fillna(0).astype(int64).to_numpy(),
+    })
+
+    team_matches = concat(
+        [
+            matches.assign(alliance=alliance, team=schedule[f"{alliance}_alliance"].to_numpy()).explode("team")
+            for alliance in (Queries.RED_ALLIANCE, Queries.BLUE_ALLIANCE)
+        ],
+        ignore_index=True
+    ).dropna(subset=["team"])
+    team_matches["team"] = team_matches["team"].astype(int64)
 
-    try:
-        event_matches = [
-            match
-            for match in tba_instance.event_matches(EventSpecificConstants.EVENT_CODE)
-            if match["comp_level"] == "qm"
-        ]
-    except Exception:
-        return DataFrame()
+    return team_matches.sort_values("schedule_position", kind="stable").reset_index(drop=True)
 
-    if event_matches:
+
+def _match_results_from_event_matches(event_matches: list[dict]) -> DataFrame:
+    """Creates the results of the qualification matches played from the matches at an event.
+
+    :param event_matches: The matches at an event from TBA.
+    :return: A dataframe with the alliances, RPs and scores of every qualification match played.
+    """
+    try:
         return DataFrame(
             [
                 {
@@ -183,13 +466,239 @@ def retrieve_match_data() -> DataFrame:
                     "red_score": match["alliances"]["red"]["score"],
                     "blue_score": match["alliances"]["blue"]["score"],
                 }
-                for match in event_matches if match["score_breakdown"] is not None
+                for match in event_matches
+                if match["comp_level"] == "qm" and match["score_breakdown"] is not None
             ]
         )
-    else:
+    except Exception:
         return DataFrame()
 
 
+def _parse_event_matches(raw: bytes | str) -> _EventMatches:
+    """Parses the raw JSON of the matches at an event from TBA.
+
+    :param raw: The raw JSON of the matches at an event.
+    :return: The matches at the event alongside their schedule and results.
+    """
+    event_matches = _EventMatches(loads(raw))
+    save_snapshot("match_schedule", event_matches.schedule)
+    save_snapshot("match_results", event_matches.results)
+    return event_matches
+
+
+def _load_event_matches() -> _EventMatches:
+    """Loads the latest matches at the current event from TBA.
+
+    :return: The matches at the event alongside their schedule and results.
+    """
+    return fetch_conditionally(
+        EventSpecificConstants.TBA_EVENT_MATCHES_URL,
+        _parse_event_matches,
+        GeneralConstants.TBA_TIMEOUT,
+        headers={"X-TBA-Auth-Key": _TBA_AUTH_KEY}
+    )
+
+
+def _load_local_event_matches() -> _EventMatches:
+    """Loads the snapshots of the last match schedule and results fetched, used when TBA can't be reached.
+
+    :return: The matches at the event without their raw data (the schedule falls back to the local match schedule).
+    """
+    if (schedule := load_snapshot("match_schedule")) is not None:
+        for alliance in ("red_alliance", "blue_alliance"):
+            schedule[alliance] = schedule[alliance].map(list)
+
+    return _EventMatches([], schedule=schedule, results=load_snapshot("match_results"))
+
+
+_EVENT_MATCHES = SnapshotRefresher(
+    _load_event_matches, GeneralConstants.SECONDS_TO_CACHE // 2, "event-matches", fallback=_load_local_event_matches
+)
+
+
+def retrieve_match_schedule() -> DataFrame:
+    """Retrieves the match schedule for the current event using TBA."""
+    return _EVENT_MATCHES.get().schedule
+
+
+def retrieve_match_schedule_with_version() -> tuple[str, DataFrame]:
+    """Retrieves the match schedule for the current event alongside the version of the TBA match data.
+
+    :return: A tuple of the version of the TBA match data and the match schedule.
+    """
+    version, event_matches = _EVENT_MATCHES.get_with_version()
+    return version, event_matches.schedule
+
+
+def retrieve_team_matches() -> DataFrame:
+    """Retrieves the match schedule for the current event as one row per team per match.
+
+    :return: A dataframe with the position of each match within `retrieve_match_schedule`, its key, comp level
+             ("qm", "sf" or "f"), set and match number, and the alliance and number of each team playing in it.
+    """
+    return _EVENT_MATCHES.get().team_matches
+
+
+def matches_for_team(team_number: int) -> DataFrame:
+    """Retrieves the matches a team is scheduled to play at the current event, in the order they're played.
+
+    :param team_number: The number of the team to retrieve the matches for.
+    :return: The rows of the match schedule (see `retrieve_match_schedule`) containing the team.
+    """
+    event_matches = _EVENT_MATCHES.get()
+    return event_matches.schedule.iloc[event_matches.matches_by_team.get(team_number, [])]
+
+
+def retrieve_match_data_raw() -> list[dict]:
+    """Retrieves the raw TBA match data (including score breakdowns) at the current event."""
+    return _EVENT_MATCHES.get().raw
+
+
+def retrieve_match_data() -> DataFrame:
+    """Retrieves the TBA match data at an event up to the latest matches they've played."""
+    return _EVENT_MATCHES.get().results
+
+
+def retrieve_match_data_with_version() -> tuple[str, DataFrame]:
+    """Retrieves the TBA match data at an event alongside its version.
+
+    :return: A tuple of the version of the TBA match data and the match data itself.
+    """
+    version, event_matches = _EVENT_MATCHES.get_with_version()
+    return version, event_matches.results
+
+
+@st.cache_resource(show_spinner="Loading event data...")
+def prefetch_data_sources() -> None:
+    """Fetches the scouting data, TBA matches and Statbotics data concurrently so the first page load waits for the
+    slowest of them only.
+
+    This runs once per process (the first time any page is loaded) and starts each source's refresher.
+    """
+    sources = (
+        retrieve_scouting_data,
+        retrieve_match_schedule,
+        retrieve_statbotics_data,
+    )
+
+    with ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="prefetch") as executor:
+        for future in [executor.submit(source) for source in sources]:
+            future.exception()
+
+
+def setup_page() -> None:
+    """Sets up a page of FalconVis, which every page calls once right after `st.set_page_config`.
+
+    Copy-on-write is enabled so that the data shared between sessions can't be modified through the dataframes
+    derived from it, the data sources are prefetched and the data sources that are offline are indicated.
+    """
+    set_option("mode.copy_on_write", True)
+    prefetch_data_sources()
+    offline_indicator()
+
+
+def team_row_positions(scouting_data: DataFrame) -> dict[int, ndarray]:
+    """Retrieves a mapping of each team to the row positions of its submissions within the scouting data.
+
+    The mapping is built once per dataframe with a single groupby and reused by every later lookup against
+    that same dataframe, so the dataframe passed in should be treated as read-only afterwards.
+
+    :param scouting_data: The scouting data to index by team.
+    :return: A dictionary mapping team numbers to arrays of row positions (usable with `DataFrame.iloc`).
+    """
+    key = id(scouting_data)
+
+    if (cached := _TEAM_ROW_POSITIONS.get(key)) is not None and cached[0]() is scouting_data:
+        return cached[1]
+
+    if Queries.TEAM_NUMBER in scouting_data.columns:
+        positions = {
+            team: rows
+            for team, rows in scouting_data.groupby(Queries.TEAM_NUMBER, sort=False).indices.items()
+        }
+    else:
+        positions = {}
+
+    # Drop the index as soon as the dataframe it belongs to is garbage collected.
+    _TEAM_ROW_POSITIONS[key] = (ref(scouting_data, lambda _: _TEAM_ROW_POSITIONS.pop(key, None)), positions)
+    return positions
+
+
+def _rows_for_team(team_number: int, scouting_data: DataFrame) -> DataFrame:
+    """Looks up the rows belonging to a team through the team index of the scouting data.
+
+    :param team_number: The number of the team to retrieve the rows for.
+    :param scouting_data: The scouting data to retrieve the rows from.
+    :return: A dataframe containing only the rows of the team passed in (empty if the team has no rows).
+    """
+    rows = team_row_positions(scouting_data).get(team_number)
+    return scouting_data.iloc[rows] if rows is not None else scouting_data.iloc[0:0]
+
+
+def encode_scouting_data(scouting_data: DataFrame) -> DataFrame:
+    """Adds compact numeric encodings of the rating and boolean fields to the scouting data.
+
+    Ratings are encoded as float32 columns (NaN when missing or unrecognized), the teleop climb level as an int8
+    column and boolean fields as bool columns, so that calculations can read them without mapping each value
+    through the `Criteria` dictionaries again. Multi-select fields (lists or concatenated strings of options) are
+    replaced by uint8 bitmasks with one bit per option of their fixed vocabulary (unknown options are dropped),
+    which `option_counts` counts. The notes of each submission are also combined and scored for
+    positivity (NaN without notes), so that each note is only analyzed once.
+
+    :param scouting_data: The scouting data to encode (modified in place).
+    :return: The scouting data with the encoded columns added.
+    """
+    def _field(field: str) -> Series:
+        if field in scouting_data.columns:
+            return scouting_data[field]
+        return Series(None, index=scouting_data.index, dtype=object)
+
+    for field, (encoded_field, criteria) in _RATING_ENCODINGS.items():
+        scouting_data[encoded_field] = _field(field).map(criteria).astype(float32)
+
+    for field, encoded_field in _FLAG_ENCODINGS.items():
+        scouting_data[encoded_field] = _field(field).map(Criteria.BOOLEAN_CRITERIA).fillna(0).astype(bool)
+
+    teleop_climb = _field(Queries.TELEOP_CLIMB)
+    scouting_data[Queries.TELEOP_CLIMB_LEVEL] = teleop_climb.map(Criteria.CLIMBING_CRITERIA).fillna(0).astype(int8)
+    scouting_data[Queries.TELEOP_CLIMB_FLAG] = teleop_climb.notna() & (teleop_climb != "No climb")
+
+    for field, (encoded_field, options) in _MULTI_SELECT_ENCODINGS.items():
+        selections = _field(field).map(lambda value: "".join(value) if isinstance(value, list) else value)
+        selections = selections.fillna("").astype(str)
+
+        masks = zeros(len(scouting_data), dtype=uint8)
+        for bit, option in enumerate(options):
+            masks |= selections.str.contains(option, regex=False).to_numpy(dtype=uint8) << uint8(bit)
+
+        scouting_data[encoded_field] = masks
+
+    scouting_data.drop(columns=[field for field in _MULTI_SELECT_ENCODINGS if field in scouting_data], inplace=True)
+
+    notes = combined_notes(scouting_data)
+    scouting_data[Queries.NOTES] = notes
+    scouting_data[Queries.NOTES_POSITIVITY] = notes.map(
+        lambda note: notes_positivity(note) if note.strip() else None
+    ).astype(float)
+
+    return scouting_data
+
+
+def option_counts(masks: Series, options: list[str]) -> dict[str, int]:
+    """Counts how many times each option of a multi-select field was selected.
+
+    :param masks: The bitmasks of the field (e.g. `Queries.AUTO_SCORING_SIDE_MASK`) for the submissions to count.
+    :param options: The options of the field, in the order of their bits (e.g. `Criteria.SCORING_SIDE_OPTIONS`).
+    :return: A dictionary mapping each option selected at least once to its count, from most to least selected.
+    """
+    counts = ((masks.to_numpy(dtype=uint8)[:, None] >> arange(len(options), dtype=uint8)) & 1).sum(axis=0)
+    return {
+        options[bit]: int(counts[bit])
+        for bit in sorted(range(len(options)), key=lambda bit: counts[bit], reverse=True)
+        if counts[bit]
+    }
+
+
 def scouting_data_for_team(team_number: int, scouting_data: DataFrame | None = None) -> DataFrame:
     """Retrieves the submissions within the scouting data for a certain team.
 
@@ -200,9 +709,7 @@ def scouting_data_for_team(team_number: int, scouting_data: DataFrame | None = N
     if scouting_data is None:
         scouting_data = retrieve_scouting_data()
 
-    return scouting_data[
-        scouting_data["TeamNumber"] == team_number
-        ]
+    return _rows_for_team(team_number, scouting_data)
 
 
 def note_scouting_data_for_team(team_number: int, scouting_data: DataFrame | None = None) -> DataFrame:
@@ -215,9 +722,7 @@ def note_scouting_data_for_team(team_number: int, scouting_data: DataFrame | Non
     if scouting_data is None:
         scouting_data = retrieve_note_scouting_data()
 
-    return scouting_data[
-        scouting_data["TeamNumber"] == team_number
-        ]
+    return _rows_for_team(team_number, scouting_data)
 
 
 def retrieve_team_list(scouting_data: DataFrame = None) -> list:
@@ -254,7 +759,10 @@ def _convert_to_float_from_numpy_type(function):
 
 def check_utf8(list_of_dicts: list[dict]) -> list[dict]:
     """
-    Removes all non-UTF-8 characters from string values of dictionaries contained in lists.
+    Removes all control characters (C0 and C1) from string values of dictionaries contained in lists.
+
+    Strings are only rewritten (with a precompiled translation table) when they contain a character that isn't
+    printable, which is checked in C and is rarely the case.
 
     :param list_of_dicts: The list of dictionaries with values to be cleaned
     :return: The cleaned list of dictionaries
@@ -262,7 +770,7 @@ def check_utf8(list_of_dicts: list[dict]) -> list[dict]:
 
     for d in list_of_dicts:
         for key, value in d.items():
-            if isinstance(value, str):
-                d[key] = sub(r'[\x00-\x1F\x7F-\x9F]', '', value)
+            if isinstance(value, str) and not value.isprintable():
+                d[key] = value.translate(_CONTROL_CHARACTERS)
 
     return list_of_dicts
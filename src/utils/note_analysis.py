@@ -0,0 +1,101 @@
+"""Defines the analysis of the notes that scouts write about a team during a match."""
+
+import re
+from functools import cache, lru_cache
+
+from pandas import DataFrame, Series
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from .constants import GeneralConstants, Queries
+
+__all__ = ["annotate_notes", "combined_notes", "notes_positivity"]
+
+
+def _alternation(terms: set[str]) -> str:
+    """Creates a regex alternation matching any of the terms (longest terms first).
+
+    :param terms: The terms to match.
+    :return: The alternation of the escaped terms.
+    """
+    return "|".join(map(re.escape, sorted(terms, key=len, reverse=True)))
+
+
+# Matches every whole word containing a positive term (preferred) or a negative term in a single pass.
+_SENTIMENT_WORDS = re.compile(
+    rf"(?<!\S)(?:(?P<positive>\S*(?:{_alternation(GeneralConstants.POSITIVE_TERMS)})\S*)"
+    rf"|(?P<negative>\S*(?:{_alternation(GeneralConstants.NEGATIVE_TERMS)})\S*))"
+)
+
+
+@cache
+def _sentiment_analyzer() -> SentimentIntensityAnalyzer:
+    """Loads the VADER sentiment analyzer (and its lexicon) once per process.
+
+    :return: The sentiment analyzer shared by every note analyzed.
+    """
+    return SentimentIntensityAnalyzer()
+
+
+def _term_sentiment_estimate(notes: str) -> float:
+    """Estimates how positive notes are from the positive and negative terms within them.
+
+    :param notes: The (lowercase) notes to analyze.
+    :return: The average sentiment (1 for positive and -1 for negative) of the words that contain a term.
+    """
+    sentiment_scores = [1 if match.lastgroup == "positive" else -1 for match in _SENTIMENT_WORDS.finditer(notes)]
+    return sum(sentiment_scores) / (len(sentiment_scores) or 1)
+
+
+@lru_cache(maxsize=None)
+def notes_positivity(notes: str) -> float:
+    """Scores how positive notes are, averaging VADER's compound score with the estimate from positive/negative terms.
+
+    Scores are cached by the contents of the notes, so each note is only analyzed once per process.
+
+    :param notes: The (lowercase) notes to analyze.
+    :return: The positivity of the notes, from -1 (negative) to 1 (positive).
+    """
+    return (_sentiment_analyzer().polarity_scores(notes)["compound"] + _term_sentiment_estimate(notes)) / 2
+
+
+@lru_cache(maxsize=4096)
+def annotate_notes(notes: str) -> tuple[str | tuple[str, str, str], ...]:
+    """Highlights the words in notes that contain a positive (green) or negative (red) term.
+
+    The notes are annotated in a single pass and the annotations are cached by the contents of the notes.
+
+    :param notes: The notes to annotate.
+    :return: The segments of the notes to pass to `annotated_text`, where highlighted words are tuples of the word,
+             an empty label and the background color.
+    """
+    segments = []
+    last_end = 0
+
+    for match in _SENTIMENT_WORDS.finditer(notes):
+        if match.start() > last_end:
+            segments.append(notes[last_end:match.start()])
+
+        color = GeneralConstants.LIGHT_GREEN if match.lastgroup == "positive" else GeneralConstants.LIGHT_RED
+        segments.append((match.group(), "", f"{color}75"))
+        last_end = match.end()
+
+    if last_end < len(notes):
+        segments.append(notes[last_end:])
+
+    return tuple(segments)
+
+
+def combined_notes(scouting_data: DataFrame) -> Series:
+    """Combines the auto, teleop and rating notes of each submission into one lowercase note.
+
+    :param scouting_data: The scouting data containing the notes.
+    :return: The combined notes of each submission (an empty string for submissions without notes).
+    """
+    def _notes(field: str, separator: str) -> Series:
+        if field not in scouting_data.columns:
+            return Series("", index=scouting_data.index, dtype=object)
+
+        notes = scouting_data[field].fillna("").astype(str).str.lower()
+        return notes.where(notes == "", notes + separator)
+
+    return _notes(Queries.AUTO_NOTES, " ") + _notes(Queries.TELEOP_NOTES, " ") + _notes(Queries.RATING_NOTES, "")
@@ -0,0 +1,167 @@
+"""Defines the engine used to sync pages (such as the picklist) to a Notion database in bulk."""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Callable
+
+from notion_client import Client
+from notion_client.errors import HTTPResponseError
+from notion_client.helpers import collect_paginated_api, get_id
+
+from .constants import GeneralConstants
+
+__all__ = ["NotionSync"]
+
+# Statuses of responses from Notion after which a request can safely be sent again (conflicts, rate limits and
+# transient server errors).
+_RETRYABLE_STATUSES = {409, 429, 500, 502, 503, 504}
+
+
+class NotionSync:
+    """Syncs pages to a Notion database, creating the pages missing and updating the rest.
+
+    The database is listed once to map the title of each existing page to its id, then every page is pushed
+    through a small pool of workers. Requests are spaced out to stay within Notion's rate limit (shared by every
+    worker), and requests that are rate limited or fail transiently are retried with exponential backoff,
+    waiting for as long as Notion asks to (its `Retry-After` header) when it does.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        database_url: str,
+        title_property: str,
+        max_workers: int = GeneralConstants.NOTION_MAX_WORKERS,
+        requests_per_second: float = GeneralConstants.NOTION_REQUESTS_PER_SECOND,
+        max_retries: int = GeneralConstants.NOTION_MAX_RETRIES
+    ):
+        """Creates a sync engine for a Notion database.
+
+        :param client: The Notion client to send requests with (its `base_url` can point to a stub server).
+        :param database_url: The URL (or id) of the database to sync pages to.
+        :param title_property: The name of the title property identifying each page in the database.
+        :param max_workers: The number of requests sent concurrently.
+        :param requests_per_second: The average number of requests sent per second across all workers.
+        :param max_retries: The number of times a rate limited or transiently failing request is retried.
+        """
+        self.client = client
+        self.database_id = get_id(database_url) if database_url.startswith("http") else database_url
+        self.title_property = title_property
+        self.max_workers = max_workers
+        self.request_interval = 1 / requests_per_second
+        self.max_retries = max_retries
+
+        self._data_source_id: str | None = None
+        self._next_request_at = 0.0
+        self._throttle_lock = Lock()
+
+    def _throttle(self, delay: float = 0.0) -> None:
+        """Waits until the next request can be sent without going over the rate limit.
+
+        :param delay: An optional number of seconds every request has to wait for (e.g. after being rate limited).
+        """
+        with self._throttle_lock:
+            now = monotonic()
+            send_at = max(now + delay, self._next_request_at)
+            self._next_request_at = send_at + self.request_interval
+
+        if send_at > now:
+            sleep(send_at - now)
+
+    def _request(self, function: Callable[..., Any], **kwargs: Any) -> Any:
+        """Sends a request to Notion, retrying it when it's rate limited or fails transiently.
+
+        :param function: The endpoint of the Notion client to call (e.g. `client.pages.create`).
+        :param kwargs: The arguments of the request.
+        :return: The response from Notion.
+        """
+        delay = 0.0
+
+        for attempt in range(self.max_retries + 1):
+            self._throttle(delay)
+
+            try:
+                return function(**kwargs)
+            except HTTPResponseError as error:
+                if error.status not in _RETRYABLE_STATUSES or attempt == self.max_retries:
+                    raise
+
+                try:
+                    delay = float(error.headers.get("Retry-After"))
+                except (TypeError, ValueError):
+                    delay = GeneralConstants.HTTP_BACKOFF_FACTOR * 2 ** attempt
+
+    @property
+    def data_source_id(self) -> str:
+        """The id of the data source holding the database's pages and properties."""
+        if self._data_source_id is None:
+            database = self._request(self.client.databases.retrieve, database_id=self.database_id)
+            self._data_source_id = database["data_sources"][0]["id"]
+
+        return self._data_source_id
+
+    def update_schema(self, properties: dict, icon: dict | None = None) -> None:
+        """Updates the properties of the database (and optionally its icon).
+
+        :param properties: The properties to add or update, by name.
+        :param icon: The icon of the database.
+        """
+        self._request(self.client.data_sources.update, data_source_id=self.data_source_id, properties=properties)
+
+        if icon is not None:
+            self._request(self.client.databases.update, database_id=self.database_id, icon=icon)
+
+    def existing_pages(self) -> dict[str, str]:
+        """Lists the database once to map the title of each of its pages to the page's id.
+
+        :return: A dictionary mapping the title of each page in the database to its id.
+        """
+        pages = collect_paginated_api(
+            lambda **kwargs: self._request(self.client.data_sources.query, **kwargs),
+            data_source_id=self.data_source_id,
+            page_size=100
+        )
+
+        return {
+            "".join(text["plain_text"] for text in page["properties"][self.title_property]["title"]): page["id"]
+            for page in pages
+        }
+
+    def sync(self, pages: dict[str, dict]) -> tuple[int, int]:
+        """Creates or updates every page passed in, matching them to the existing pages by title.
+
+        Every page is attempted even if some fail, after which the first error raised (if any) is re-raised.
+
+        :param pages: A dictionary mapping the title of each page to its `properties`, `icon` and `children`
+                      (which are only written when the page is created).
+        :return: The number of pages created and the number of pages updated.
+        """
+        existing_pages = self.existing_pages()
+
+        def _sync_page(title: str, page: dict) -> None:
+            if (page_id := existing_pages.get(title)) is None:
+                self._request(
+                    self.client.pages.create,
+                    parent={"type": "data_source_id", "data_source_id": self.data_source_id},
+                    icon=page.get("icon"),
+                    properties=page["properties"],
+                    children=page.get("children", [])
+                )
+            else:
+                self._request(
+                    self.client.pages.update,
+                    page_id=page_id,
+                    icon=page.get("icon"),
+                    properties=page["properties"]
+                )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="notion-sync") as executor:
+            futures = [executor.submit(_sync_page, title, page) for title, page in pages.items()]
+
+        for future in futures:
+            if (error := future.exception()) is not None:
+                raise error
+
+        created = len(pages.keys() - existing_pages.keys())
+        return created, len(pages) - created
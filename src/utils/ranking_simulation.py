@@ -0,0 +1,115 @@
+"""Defines the Monte Carlo engine used to simulate the final qualification rankings of an event."""
+
+import numpy as np
+from pandas import DataFrame
+
+__all__ = ["BONUS_RPS", "simulate_rankings"]
+
+# Bonus RPs an alliance can earn in a match, in the order returned by `CalculatedStats.chance_of_bonuses_batch`.
+BONUS_RPS = ("scoring", "supercharged", "traversal")
+RPS_PER_WIN = 3
+ALLIANCE_CAPTAINS = 8
+
+
+def _alliance_array(alliances: list[list[int]]) -> np.ndarray:
+    """Converts a list of alliances into a (matches × teams per alliance) array.
+
+    :param alliances: The teams on each alliance.
+    :return: An integer array with one row per alliance.
+    """
+    return np.array(alliances, dtype=int).reshape(len(alliances), -1) if len(alliances) else np.empty((0, 3), dtype=int)
+
+
+def _incidence_matrix(alliances: np.ndarray, teams: np.ndarray) -> np.ndarray:
+    """Creates a matrix marking which teams play on each alliance.
+
+    :param alliances: The teams on each alliance (one row per match).
+    :param teams: The sorted teams at the event.
+    :return: A (matches × teams) matrix where an element is 1 if the team plays on that match's alliance.
+    """
+    incidence = np.zeros((len(alliances), len(teams)))
+    if alliances.size:
+        np.add.at(
+            incidence,
+            (np.repeat(np.arange(len(alliances)), alliances.shape[1]), np.searchsorted(teams, alliances.ravel())),
+            1
+        )
+    return incidence
+
+
+def simulate_rankings(
+    standings: DataFrame,
+    remaining_matches: DataFrame,
+    simulations: int = 10_000,
+    seed: int | None = None
+) -> DataFrame:
+    """Simulates the rest of the qualification schedule many times to find each team's distribution of final rank.
+
+    Every simulation samples the winner of each remaining match and whether each alliance earns each bonus RP
+    from their predicted chances, adds those RPs to the current standings and ranks teams by average RP
+    (ties are broken by average match score).
+
+    :param standings: The current standings, with `team`, `rp` (average RP), `match_score` (average match score)
+                      and `matches_played` columns.
+    :param remaining_matches: The matches left to play, with `red_alliance`/`blue_alliance` lists of teams, the
+                              `red_win_chance` of each match, the `red_score`/`blue_score` predicted for each
+                              alliance and a `{alliance}_{bonus}_rp_chance` column for every bonus RP.
+    :param simulations: The number of times to simulate the remaining matches.
+    :param seed: An optional seed used to make the simulations reproducible.
+    :return: A dataframe with one row per team (sorted by average rank) containing their expected average RP,
+             rank statistics, the chance of being the first seed/an alliance captain (top 8) and the
+             distribution of their final rank.
+    """
+    red_alliances = _alliance_array(remaining_matches["red_alliance"].tolist())
+    blue_alliances = _alliance_array(remaining_matches["blue_alliance"].tolist())
+    teams = np.union1d(standings["team"].to_numpy(dtype=int), np.concatenate([red_alliances, blue_alliances], axis=None))
+
+    current = standings.set_index("team").reindex(teams).fillna(0)
+    matches_played = current["matches_played"].to_numpy(dtype=float)
+    rp_totals = current["rp"].to_numpy(dtype=float) * matches_played
+    score_totals = current["match_score"].to_numpy(dtype=float) * matches_played
+
+    red_incidence = _incidence_matrix(red_alliances, teams)
+    blue_incidence = _incidence_matrix(blue_alliances, teams)
+    total_matches = np.maximum(matches_played + red_incidence.sum(axis=0) + blue_incidence.sum(axis=0), 1)
+
+    # Sample the outcome of every remaining match in every simulation at once (simulations × matches).
+    rng = np.random.default_rng(seed)
+    shape = (simulations, len(remaining_matches))
+    red_wins = rng.random(shape) < remaining_matches["red_win_chance"].to_numpy(dtype=float)
+    red_rps = RPS_PER_WIN * red_wins
+    blue_rps = RPS_PER_WIN * ~red_wins
+
+    for bonus in BONUS_RPS:
+        red_rps = red_rps + (rng.random(shape) < remaining_matches[f"red_{bonus}_rp_chance"].to_numpy(dtype=float))
+        blue_rps = blue_rps + (rng.random(shape) < remaining_matches[f"blue_{bonus}_rp_chance"].to_numpy(dtype=float))
+
+    average_rps = (rp_totals + red_rps @ red_incidence + blue_rps @ blue_incidence) / total_matches
+    average_scores = (
+        score_totals
+        + remaining_matches["red_score"].to_numpy(dtype=float) @ red_incidence
+        + remaining_matches["blue_score"].to_numpy(dtype=float) @ blue_incidence
+    ) / total_matches
+
+    # Rank by average RP first and average match score second (simulations × teams, 1 = first seed).
+    order = np.lexsort((np.broadcast_to(-average_scores, average_rps.shape), -average_rps), axis=-1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, len(teams) + 1), axis=-1)
+
+    # Count how often each team finished at each rank (teams × ranks).
+    rank_distribution = np.bincount(
+        (np.arange(len(teams)) * len(teams) + ranks - 1).ravel(), minlength=len(teams) ** 2
+    ).reshape(len(teams), len(teams)) / simulations
+
+    return DataFrame(
+        {
+            "Team": teams,
+            "Expected Average RP": average_rps.mean(axis=0),
+            "Average Rank": ranks.mean(axis=0),
+            "Best Rank": ranks.min(axis=0),
+            "Worst Rank": ranks.max(axis=0),
+            "P(#1 Seed)": (ranks == 1).mean(axis=0),
+            f"P(Top {ALLIANCE_CAPTAINS} / Captain)": (ranks <= ALLIANCE_CAPTAINS).mean(axis=0),
+            "Rank Distribution": rank_distribution.tolist(),
+        }
+    ).sort_values("Average Rank").reset_index(drop=True)
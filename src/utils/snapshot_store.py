@@ -0,0 +1,163 @@
+"""Defines the snapshot store used to persist the latest data from each source for cold starts and offline use."""
+
+import os
+from hashlib import sha256
+from io import BytesIO
+from threading import Lock
+
+from pandas import concat, DataFrame
+from pyarrow.feather import read_table
+
+from .constants import EventSpecificConstants
+
+__all__ = ["append_snapshot", "load_snapshot", "save_snapshot"]
+
+_SNAPSHOT_DIRECTORY = "./src/data/snapshots"
+
+# The number of parts appended to a snapshot after which it's saved in full again.
+_MAX_SNAPSHOT_PARTS = 32
+
+# Maps the name of each snapshot to the hash of its contents on disk and to the number of parts appended to it.
+_SNAPSHOT_HASHES: dict[str, str] = {}
+_SNAPSHOT_PARTS: dict[str, int] = {}
+_SNAPSHOT_LOCK = Lock()
+
+
+def _snapshot_path(name: str, part: int | None = None) -> str:
+    """Retrieves the path of a snapshot (or of one of the parts appended to it) for the current event.
+
+    :param name: The name of the snapshot.
+    :param part: The index of the part appended to the snapshot, if any.
+    :return: The path of the snapshot's Feather file.
+    """
+    suffix = "" if part is None else f".part{part}"
+    return os.path.join(_SNAPSHOT_DIRECTORY, f"{EventSpecificConstants.EVENT_CODE}_{name}{suffix}.feather")
+
+
+def _part_count(name: str) -> int:
+    """Retrieves the number of parts appended to a snapshot, counting them on disk the first time.
+
+    Must be called while holding `_SNAPSHOT_LOCK`.
+
+    :param name: The name of the snapshot.
+    :return: The number of parts appended to the snapshot since it was last saved in full.
+    """
+    if name not in _SNAPSHOT_PARTS:
+        count = 0
+        while os.path.exists(_snapshot_path(name, count)):
+            count += 1
+
+        _SNAPSHOT_PARTS[name] = count
+
+    return _SNAPSHOT_PARTS[name]
+
+
+def _to_feather(data: DataFrame) -> bytes | None:
+    """Serializes a dataframe into the contents of a Feather (Arrow IPC) file.
+
+    :param data: The dataframe to serialize.
+    :return: The contents of the Feather file, or None if the dataframe couldn't be serialized.
+    """
+    try:
+        buffer = BytesIO()
+        data.reset_index(drop=True).to_feather(buffer)
+        return buffer.getvalue()
+    except Exception:
+        return None
+
+
+def _write_atomically(path: str, contents: bytes) -> None:
+    """Writes a file to a temporary file first and moves it into place, so readers never see it partially written.
+
+    :param path: The path of the file to write.
+    :param contents: The contents of the file.
+    :raises OSError: If the file couldn't be written.
+    """
+    os.makedirs(_SNAPSHOT_DIRECTORY, exist_ok=True)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(temporary_path, "wb") as file:
+        file.write(contents)
+
+    os.replace(temporary_path, path)
+
+
+def save_snapshot(name: str, data: DataFrame) -> None:
+    """Saves a snapshot of a dataframe as a Feather (Arrow IPC) file, replacing any parts appended to it.
+
+    The file is only written when its contents changed, and is written to a temporary file first and moved into
+    place so readers never see a partially written snapshot. Failing to save a snapshot is never fatal.
+
+    :param name: The name of the snapshot.
+    :param data: The dataframe to save (with a default index).
+    """
+    if (contents := _to_feather(data)) is None:
+        return
+
+    content_hash = sha256(contents).hexdigest()
+    path = _snapshot_path(name)
+
+    with _SNAPSHOT_LOCK:
+        if name not in _SNAPSHOT_HASHES and os.path.exists(path):
+            with open(path, "rb") as file:
+                _SNAPSHOT_HASHES[name] = sha256(file.read()).hexdigest()
+
+        if _SNAPSHOT_HASHES.get(name) == content_hash and _part_count(name) == 0:
+            return
+
+        try:
+            # Parts are removed before the snapshot is replaced, so a crash in between can't duplicate their rows.
+            for part in reversed(range(_part_count(name))):
+                os.remove(_snapshot_path(name, part))
+                _SNAPSHOT_PARTS[name] = part
+
+            _write_atomically(path, contents)
+            _SNAPSHOT_HASHES[name] = content_hash
+        except OSError:
+            pass
+
+
+def append_snapshot(name: str, rows: DataFrame, data: DataFrame) -> None:
+    """Appends rows to a snapshot by saving them as a separate part, so the cost of saving scales with the rows.
+
+    Once `_MAX_SNAPSHOT_PARTS` parts have been appended, the snapshot is saved in full instead (see
+    `save_snapshot`) so loading it never has to read too many files. Failing to append is never fatal.
+
+    :param name: The name of the snapshot.
+    :param rows: The rows appended to the data saved last.
+    :param data: The whole dataframe after appending the rows, saved when the snapshot is saved in full.
+    """
+    if rows.empty or (contents := _to_feather(rows)) is None:
+        return
+
+    with _SNAPSHOT_LOCK:
+        if (part := _part_count(name)) < _MAX_SNAPSHOT_PARTS:
+            try:
+                _write_atomically(_snapshot_path(name, part), contents)
+                _SNAPSHOT_PARTS[name] = part + 1
+            except OSError:
+                pass
+            return
+
+    save_snapshot(name, data)
+
+
+def load_snapshot(name: str) -> DataFrame | None:
+    """Loads a snapshot saved with `save_snapshot` (and any parts appended to it) by memory-mapping its Feather
+    files.
+
+    :param name: The name of the snapshot.
+    :return: The dataframe saved, or None if there's no snapshot saved under that name.
+    """
+    with _SNAPSHOT_LOCK:
+        paths = [_snapshot_path(name), *(_snapshot_path(name, part) for part in range(_part_count(name)))]
+
+    try:
+        tables = [read_table(path, memory_map=True).to_pandas() for path in paths if os.path.exists(path)]
+    except Exception:
+        return None
+
+    if not tables:
+        return None
+
+    return tables[0] if len(tables) == 1 else concat(tables, ignore_index=True)
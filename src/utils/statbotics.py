@@ -1,16 +1,16 @@
 """Utility functions for fetching and caching Statbotics EPA data."""
 
 import json
-import os
-from datetime import datetime
 
-import requests
-import streamlit as st
+from pandas import DataFrame
 
 from .constants import EventSpecificConstants, GeneralConstants
+from .fetching import http_get, SnapshotRefresher
+from .snapshot_store import load_snapshot, save_snapshot
 
 __all__ = [
     "retrieve_statbotics_data",
+    "retrieve_statbotics_data_with_version",
     "get_team_statbotics",
     "statbotics_quantile",
 ]
@@ -25,10 +25,10 @@ def _fetch_from_api() -> dict[str, dict]:
     :return: A dict mapping team number strings to their EPA breakdown dicts.
     :raises requests.HTTPError: If the API returns a non-2xx response.
     """
-    response = requests.get(
+    response = http_get(
         f"{_STATBOTICS_BASE_URL}/team_events",
+        GeneralConstants.STATBOTICS_TIMEOUT,
         params={"event": EventSpecificConstants.EVENT_CODE, "limit": 100},
-        timeout=10,
     )
     response.raise_for_status()
 
@@ -55,30 +55,56 @@ def _fetch_from_api() -> dict[str, dict]:
     return teams
 
 
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE * 4)
+def _fetch_and_save() -> dict[str, dict]:
+    """Fetches EPA data for every team at the event and saves it as a snapshot (if it changed).
+
+    :return: A dict mapping team number strings to their EPA breakdown dicts.
+    """
+    teams = _fetch_from_api()
+    save_snapshot("statbotics", DataFrame.from_dict(teams, orient="index").rename_axis("team").reset_index())
+    return teams
+
+
+def _load_local_statbotics_data() -> dict[str, dict]:
+    """Loads the last Statbotics EPA data fetched, falling back to the JSON cache bundled with FalconVis.
+
+    :return: A dict mapping team number strings to their EPA breakdown dicts (empty if there's no local data).
+    """
+    if (snapshot := load_snapshot("statbotics")) is not None:
+        return snapshot.set_index("team").to_dict(orient="index")
+
+    try:
+        with open(_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)["teams"]
+    except Exception:
+        return {}
+
+
+_STATBOTICS_DATA = SnapshotRefresher(
+    _fetch_and_save, GeneralConstants.SECONDS_TO_CACHE * 4, "statbotics", fallback=_load_local_statbotics_data
+)
+
+
 def retrieve_statbotics_data() -> dict[str, dict]:
     """Retrieves Statbotics EPA data for all teams at the current event.
 
-    When a network connection is available the data is fetched from the
-    Statbotics API and persisted to a local JSON cache so it remains
-    accessible offline.  If the API is unreachable the cached file is
-    used as a fallback.
+    The data is refreshed from the Statbotics API on a background thread
+    and saved as a snapshot (only when it changed) so it remains
+    accessible offline.  If the API is unreachable the snapshot (or the
+    bundled JSON cache) is used as a fallback.
 
     :return: A dict mapping team number strings to their EPA breakdown dicts.
              Returns an empty dict if neither the API nor the cache is available.
     """
-    try:
-        teams = _fetch_from_api()
-        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
-        with open(_CACHE_PATH, "w", encoding="utf-8") as f:
-            json.dump({"last_updated": datetime.now().isoformat(), "teams": teams}, f, indent=2)
-        return teams
-    except Exception:
-        try:
-            with open(_CACHE_PATH, encoding="utf-8") as f:
-                return json.load(f)["teams"]
-        except Exception:
-            return {}
+    return _STATBOTICS_DATA.get()
+
+
+def retrieve_statbotics_data_with_version() -> tuple[str, dict[str, dict]]:
+    """Retrieves Statbotics EPA data for all teams at the current event alongside its version.
+
+    :return: A tuple of the version of the data and the data itself.
+    """
+    return _STATBOTICS_DATA.get_with_version()
 
 
 def get_team_statbotics(team_number: int) -> dict: